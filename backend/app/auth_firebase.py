@@ -1,64 +1,364 @@
 """Firebase ID token verification. Returns uid for storage; falls back to demo user if not configured."""
+import asyncio
+import hashlib
 import json
 import os
+import threading
+import time
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+# orjson parses the service-account blob (long JSON-escaped PEM) several times
+# faster than stdlib json; fall back silently when it isn't installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _FIREBASE_APP = None
+_FIREBASE_INIT_LOCK = threading.Lock()
 
-def _init_firebase() -> Optional[object]:
-    global _FIREBASE_APP
-    if _FIREBASE_APP is not None:
-        return _FIREBASE_APP
+try:
+    import firebase_admin
+    from firebase_admin import auth as _fb_auth
+    from firebase_admin import credentials as _fb_credentials
+except ImportError:
+    firebase_admin = None  # type: ignore
+    _fb_auth = None  # type: ignore
+    _fb_credentials = None  # type: ignore
+
+# Optional local verification: PyJWT + cryptography ship with firebase-admin
+# (pyjwt[crypto]), and verifying against Google's published certs locally
+# avoids firebase-admin's internal locking and cold-start cert fetch.
+_PYJWT_AVAILABLE = False
+try:
+    import jwt as _pyjwt
+    from cryptography.x509 import load_pem_x509_certificate as _load_cert
+    _PYJWT_AVAILABLE = True
+except ImportError:
+    pass
+
+_GOOGLE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+
+# kid -> public key, refreshed when stale or when an unknown kid shows up.
+# _CERT_LOCK only guards reads/swaps of the cache (never held across the
+# network fetch); _CERT_REFRESH_LOCK serializes the fetch itself so a cert
+# rollover doesn't trigger a thundering herd of requests to Google.
+_CERT_KEYS: dict[str, object] = {}
+_CERT_EXPIRES_AT = 0.0
+_CERT_LOCK = threading.Lock()
+_CERT_REFRESH_LOCK = threading.Lock()
+
+_PROJECT_ID: Optional[str] = None
+
+
+def _project_id() -> Optional[str]:
+    """Firebase project id for audience/issuer checks, resolved once from env."""
+    global _PROJECT_ID
+    if _PROJECT_ID is None:
+        pid = os.environ.get("FIREBASE_PROJECT_ID") or os.environ.get("GOOGLE_CLOUD_PROJECT")
+        if not pid:
+            raw = os.environ.get("FIREBASE_SERVICE_ACCOUNT_JSON", "").strip()
+            if raw:
+                try:
+                    pid = _json_loads(raw).get("project_id")
+                except (json.JSONDecodeError, ValueError, TypeError):
+                    pid = None
+        _PROJECT_ID = pid or ""
+    return _PROJECT_ID or None
+
+
+def _refresh_cert_keys() -> None:
+    """Fetch Google's token-signing certs and cache public keys until Cache-Control expiry."""
+    global _CERT_EXPIRES_AT
+    import httpx
+    resp = httpx.get(_GOOGLE_CERTS_URL, timeout=10.0)
+    resp.raise_for_status()
+    max_age = 3600
+    cache_control = resp.headers.get("cache-control", "")
+    for part in cache_control.split(","):
+        part = part.strip()
+        if part.startswith("max-age="):
+            try:
+                max_age = int(part.split("=", 1)[1])
+            except ValueError:
+                pass
+            break
+    keys = {}
+    for kid, pem in resp.json().items():
+        keys[kid] = _load_cert(pem.encode("ascii")).public_key()
+    with _CERT_LOCK:
+        _CERT_KEYS.clear()
+        _CERT_KEYS.update(keys)
+        _CERT_EXPIRES_AT = time.time() + max_age
+
+
+def _cert_key_cached(kid: str) -> Optional[object]:
+    """The kid's key if the cert cache is fresh and has it; no network."""
+    with _CERT_LOCK:
+        if time.time() >= _CERT_EXPIRES_AT:
+            return None
+        return _CERT_KEYS.get(kid)
+
+
+def _cert_key_for(kid: str) -> Optional[object]:
+    key = _cert_key_cached(kid)
+    if key is not None:
+        return key
+    with _CERT_REFRESH_LOCK:
+        # Another thread may have refreshed while we waited for the lock.
+        key = _cert_key_cached(kid)
+        if key is not None:
+            return key
+        try:
+            _refresh_cert_keys()
+        except Exception:
+            return None
+    with _CERT_LOCK:
+        return _CERT_KEYS.get(kid)
+
+
+def _local_verify_may_block(token: str) -> bool:
+    """True when the local path would need a cert fetch (network) for this token."""
+    if not _PYJWT_AVAILABLE or not _project_id():
+        return False
     try:
-        import firebase_admin
-        from firebase_admin import credentials
-    except ImportError:
+        kid = _pyjwt.get_unverified_header(token).get("kid")
+    except Exception:
+        return False  # malformed: the local path 401s without touching the network
+    return not kid or _cert_key_cached(kid) is None
+
+
+def _verify_token_local(token: str) -> Optional[dict]:
+    """Verify an ID token with PyJWT against Google's certs. Returns claims, or None if this path is unavailable."""
+    project_id = _project_id()
+    if not _PYJWT_AVAILABLE or not project_id:
         return None
-    if firebase_admin._apps:
-        _FIREBASE_APP = firebase_admin.get_app()
-        return _FIREBASE_APP
-    # Prefer JSON string (e.g. in .env); else path
+    try:
+        kid = _pyjwt.get_unverified_header(token).get("kid")
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+    key = _cert_key_for(kid) if kid else None
+    if key is None:
+        # Cert fetch failed or unknown kid: let the firebase-admin path decide.
+        return None
+    try:
+        return _pyjwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=project_id,
+            issuer=f"https://securetoken.google.com/{project_id}",
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+
+# Verified-token cache: token digest -> (uid, exp unix). Firebase ID tokens are
+# immutable once signed, so we only need to re-check expiry on repeat sightings
+# instead of paying RSA verification on every request.
+_TOKEN_CACHE: dict[bytes, tuple[str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_MAX = 10000
+_TOKEN_EXP_SLACK_SEC = 30
+
+
+_CLOCK_SKEW_SEC = 60
+
+
+def _unverified_claims(token: str) -> Optional[dict]:
+    """Decode the JWT payload without verifying the signature. Returns None if malformed."""
+    import base64
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1]
+    try:
+        decoded = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        claims = _json_loads(decoded)
+    except (ValueError, TypeError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def _precheck_token(token: str) -> None:
+    """Reject malformed or obviously expired tokens before paying for signature verification."""
+    claims = _unverified_claims(token)
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+    now = time.time()
+    exp = claims.get("exp")
+    iat = claims.get("iat")
+    if (isinstance(exp, (int, float)) and exp < now) or (
+        isinstance(iat, (int, float)) and iat > now + _CLOCK_SKEW_SEC
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _cached_entry(token: str) -> Optional[tuple[str, float]]:
+    """Return (uid, exp) for a previously verified, still-valid token, else None."""
+    key = _token_cache_key(token)
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+    if entry is None:
+        return None
+    if time.time() < entry[1] - _TOKEN_EXP_SLACK_SEC:
+        return entry
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.pop(key, None)
+    return None
+
+
+def _cache_uid(token: str, uid: str, exp: Optional[float]) -> None:
+    if not exp:
+        return
+    key = _token_cache_key(token)
+    with _TOKEN_CACHE_LOCK:
+        if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+            # Drop expired entries first; fall back to clearing if still full.
+            now = time.time()
+            for k in [k for k, (_, e) in _TOKEN_CACHE.items() if e <= now]:
+                del _TOKEN_CACHE[k]
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.clear()
+        _TOKEN_CACHE[key] = (uid, exp)
+
+def _build_credential() -> Optional[object]:
+    """Build a service-account credential from env. Prefer JSON string (e.g. in .env); else path."""
     raw = os.environ.get("FIREBASE_SERVICE_ACCOUNT_JSON", "").strip()
     if raw:
         try:
-            cred_dict = json.loads(raw)
-            cred = credentials.Certificate(cred_dict)
+            return _fb_credentials.Certificate(_json_loads(raw))
         except (json.JSONDecodeError, ValueError, TypeError):
-            cred = None
-    else:
-        path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "").strip()
-        if path and os.path.isfile(path):
-            cred = credentials.Certificate(path)
-        else:
-            cred = None
-    if cred is None:
+            return None
+    path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "").strip()
+    if path and os.path.isfile(path):
+        return _fb_credentials.Certificate(path)
+    return None
+
+
+# Parsed once at import (JSON decode + RSA key load are not cheap); the
+# runtime init below only has to call initialize_app.
+_CRED = _build_credential() if firebase_admin is not None else None
+
+
+def _init_firebase() -> Optional[object]:
+    global _FIREBASE_APP
+    if _FIREBASE_APP is not None:
+        return _FIREBASE_APP
+    if firebase_admin is None:
         return None
-    _FIREBASE_APP = firebase_admin.initialize_app(cred)
-    return _FIREBASE_APP
+    with _FIREBASE_INIT_LOCK:
+        if _FIREBASE_APP is not None:
+            return _FIREBASE_APP
+        if firebase_admin._apps:
+            _FIREBASE_APP = firebase_admin.get_app()
+            return _FIREBASE_APP
+        if _CRED is None:
+            return None
+        _FIREBASE_APP = firebase_admin.initialize_app(_CRED)
+        return _FIREBASE_APP
+
 
+def _get_firebase_uid_demo() -> str:
+    """No Firebase configured: every request is the demo user. FastAPI never
+    has to construct or resolve the HTTPBearer dependency on this path."""
+    return "demo"
 
-def get_firebase_uid(
-    creds: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+
+# firebase-admin serializes verifications behind an internal lock, so cap how
+# many of those calls we park on threads at once. The local PyJWT path is pure
+# CPU on cached certs and runs inline.
+_VERIFY_SEMAPHORE = asyncio.Semaphore(16)
+
+
+def _stamp_cache_headers(response: Optional[Response], exp: Optional[float]) -> None:
+    """Allow clients to reuse authenticated GETs briefly while the token is still fresh."""
+    if response is None or not exp:
+        return
+    if exp - time.time() > 30:
+        response.headers["Cache-Control"] = "private, max-age=30"
+
+
+_BEARER = HTTPBearer(auto_error=False)
+
+
+async def _get_firebase_uid_real(
+    response: Response,
+    creds: Optional[HTTPAuthorizationCredentials] = Depends(_BEARER),
 ) -> str:
     """Verify Firebase ID token and return uid. If Firebase not configured or no valid token, returns 'demo' or 401."""
     app = _init_firebase()
     if app is None:
-        # No service account: treat as demo user so app works without setup
+        # Init failed despite configuration: treat as demo so app still works
         return "demo"
     if creds is None or not creds.credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing or invalid Authorization header",
         )
+    token = creds.credentials
+    entry = _cached_entry(token)
+    if entry is not None:
+        _stamp_cache_headers(response, entry[1])
+        return entry[0]
+    _precheck_token(token)
+    if _local_verify_may_block(token):
+        # Stale cert cache or unknown kid: the local path would fetch Google's
+        # certs synchronously, so keep that off the event loop.
+        decoded = await asyncio.to_thread(_verify_token_local, token)
+    else:
+        decoded = _verify_token_local(token)
+    if decoded is not None:
+        uid = decoded.get("user_id") or decoded.get("sub")
+        if not uid:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+            )
+        _cache_uid(token, uid, decoded.get("exp"))
+        _stamp_cache_headers(response, decoded.get("exp"))
+        return uid
     try:
-        from firebase_admin import auth
-        decoded = auth.verify_id_token(creds.credentials)
-        return decoded["uid"]
+        async with _VERIFY_SEMAPHORE:
+            decoded = await asyncio.to_thread(_fb_auth.verify_id_token, token)
+        uid = decoded["uid"]
+        _cache_uid(token, uid, decoded.get("exp"))
+        _stamp_cache_headers(response, decoded.get("exp"))
+        return uid
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
+
+
+# Routers resolve this alias when they register their dependencies; in the
+# common demo-mode deployment FastAPI skips bearer parsing entirely.
+_FIREBASE_CONFIGURED = firebase_admin is not None and (
+    _CRED is not None or bool(firebase_admin._apps)
+)
+get_firebase_uid = _get_firebase_uid_real if _FIREBASE_CONFIGURED else _get_firebase_uid_demo
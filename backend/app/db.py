@@ -1,44 +1,163 @@
 """Database setup and session management. Uses SQLite by default."""
 import os
-from pathlib import Path
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from app.models import Base
+from app.models import Base, User
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
-DATA_DIR.mkdir(exist_ok=True)
-DB_PATH = os.environ.get("SENTRA_DB_PATH", str(DATA_DIR / "sentra.db"))
+# abspath instead of Path.resolve(): no realpath/readlink syscalls per parent.
+DATA_DIR = os.environ.get("SENTRA_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"
+)
+if not os.path.isdir(DATA_DIR):
+    os.makedirs(DATA_DIR, exist_ok=True)
+DB_PATH = os.environ.get("SENTRA_DB_PATH", os.path.join(DATA_DIR, "sentra.db"))
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# QueuePool keeps warm connections alive instead of reopening the database
+# (and re-reading the WAL header) for every session, while still giving each
+# checked-out session its own connection -- concurrent requests must not
+# share one SQLite transaction. The enlarged query cache keeps compiled SQL
+# for all the per-request CRUD statements warm for the process lifetime.
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    query_cache_size=500,
+)
 
 
-def _migrate_voice_columns():
-    """Add voice strain and optional speech sentiment columns if missing (SQLite)."""
-    migrations = [
-        "ALTER TABLE daily_summaries ADD COLUMN voice_strain_score INTEGER",
-        "ALTER TABLE daily_summaries ADD COLUMN voice_strain_level VARCHAR(32)",
-        "ALTER TABLE daily_summaries ADD COLUMN voice_confidence VARCHAR(32)",
-        "ALTER TABLE daily_summaries ADD COLUMN speech_sentiment_compound FLOAT",
-        "ALTER TABLE daily_summaries ADD COLUMN speech_sentiment_label VARCHAR(32)",
-        "ALTER TABLE voice_sessions ADD COLUMN speech_sentiment_compound FLOAT",
-        "ALTER TABLE voice_sessions ADD COLUMN speech_sentiment_label VARCHAR(32)",
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL so readers don't block the writer, plus relaxed fsync and bigger caches."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA wal_autocheckpoint=10000")
+    cursor.close()
+
+
+def optimize_db():
+    """Run PRAGMA optimize so the query planner keeps good statistics. Called at shutdown."""
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA optimize")
+    except Exception:
+        pass
+# expire_on_commit=False: handlers read back freshly committed objects, and the
+# default would re-SELECT every attribute after each commit. Refresh explicitly
+# when server-side defaults are needed.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
+
+
+# Bump when _COLUMN_MIGRATIONS (or any future migration) changes so
+# existing databases re-run the migration block exactly once.
+SCHEMA_VERSION = 9
+
+# (table, column, SQL type) for columns added after the initial schema (SQLite).
+_COLUMN_MIGRATIONS = [
+    ("daily_summaries", "voice_strain_score", "INTEGER"),
+    ("daily_summaries", "voice_strain_level", "VARCHAR(32)"),
+    ("daily_summaries", "voice_confidence", "VARCHAR(32)"),
+    ("daily_summaries", "speech_sentiment_compound", "FLOAT"),
+    ("daily_summaries", "speech_sentiment_label", "VARCHAR(32)"),
+    ("voice_sessions", "speech_sentiment_compound", "FLOAT"),
+    ("voice_sessions", "speech_sentiment_label", "VARCHAR(32)"),
+    ("risk_scores", "momentum_label", "VARCHAR(32)"),
+    ("risk_scores", "momentum_strength", "VARCHAR(32)"),
+    ("risk_scores", "input_hash", "VARCHAR(16)"),
+    ("daily_summaries", "typing_session_count", "INTEGER"),
+]
+
+# Compiled once; the table name binds as a parameter so SQLite reuses one plan
+# across tables instead of re-parsing the query per check.
+_PRAGMA_TABLE_INFO = text("SELECT name FROM pragma_table_info(:t)")
+
+
+def _migrate_columns():
+    """Add columns introduced after the initial schema if missing (SQLite)."""
+    with engine.connect() as conn:
+        existing: dict[str, set[str]] = {}
+        for table in {t for t, _, _ in _COLUMN_MIGRATIONS}:
+            result = conn.execute(_PRAGMA_TABLE_INFO, {"t": table})
+            existing[table] = {row[0] for row in result}
+    needed = [
+        f"ALTER TABLE {table} ADD COLUMN {column} {col_type}"
+        for table, column, col_type in _COLUMN_MIGRATIONS
+        if column not in existing[table]
     ]
+    if not needed:
+        return
+    # engine.begin(): all ALTERs land atomically with a single fsync.
+    with engine.begin() as conn:
+        for stmt in needed:
+            conn.execute(text(stmt))
+
+
+# Composite (user_id, date) indexes for the hot range queries; create_all adds
+# them on fresh databases, these cover databases created before the models had
+# them. IF NOT EXISTS keeps them idempotent. daily_summaries gets a UNIQUE
+# index (one row per user per day, and the upsert target) -- the DELETE first
+# collapses any duplicates that accumulated before the constraint existed,
+# keeping the newest row.
+_INDEX_MIGRATIONS = [
+    "DELETE FROM daily_summaries WHERE id NOT IN"
+    " (SELECT MAX(id) FROM daily_summaries GROUP BY user_id, date)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_user_date ON daily_summaries (user_id, date)",
+    # Superseded by the unique index above (same leading columns)
+    "DROP INDEX IF EXISTS ix_daily_summaries_user_date",
+    "CREATE INDEX IF NOT EXISTS ix_risk_scores_user_date ON risk_scores (user_id, date)",
+    "CREATE INDEX IF NOT EXISTS ix_typing_sessions_user_date ON typing_sessions (user_id, date)",
+    "CREATE INDEX IF NOT EXISTS ix_users_org ON users (id) WHERE is_org_user = 1",
+]
+
+
+def _run_migrations():
+    _migrate_columns()
+    with engine.begin() as conn:
+        for stmt in _INDEX_MIGRATIONS:
+            conn.execute(text(stmt))
     with engine.connect() as conn:
-        for stmt in migrations:
-            try:
-                conn.execute(text(stmt))
-                conn.commit()
-            except Exception:
-                conn.rollback()
+        conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+        conn.commit()
 
 
 def init_db():
     Base.metadata.create_all(bind=engine)
-    _migrate_voice_columns()
+    if os.environ.get("SENTRA_SKIP_MIGRATE") == "1":
+        # Worker role: the leader (or a deploy step) runs DDL.
+        return
+    with engine.connect() as conn:
+        version = conn.execute(text("PRAGMA user_version")).scalar() or 0
+    if version >= SCHEMA_VERSION:
+        return
+    # With multiple uvicorn workers, let one process run DDL instead of all
+    # of them serializing on SQLite's writer lock. flock is POSIX-only; fall
+    # through to migrating directly where it's unavailable.
+    try:
+        import fcntl
+    except ImportError:
+        _run_migrations()
+        return
+    with open(DB_PATH + ".migrate.lock", "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Another worker is migrating; wait for it to finish, then skip.
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            return
+        _run_migrations()
 
 
 def get_db():
@@ -47,3 +166,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def ensure_user(db: Session, user_id: str) -> None:
+    """Make sure the user row exists: one INSERT OR IGNORE, no SELECT.
+
+    Runs inside the caller's transaction (no commit here) so the row lands
+    with the rest of the request's writes.
+    """
+    db.execute(
+        sqlite_insert(User).values(id=user_id, is_org_user=False).on_conflict_do_nothing()
+    )
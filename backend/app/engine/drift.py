@@ -1,5 +1,9 @@
 """Personal Behavioral Drift Engine: baseline, z-scores, risk score, momentum."""
-from datetime import date, timedelta
+import hashlib
+import threading
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
 import numpy as np
@@ -40,9 +44,87 @@ WEIGHTS = {
 }
 
 
+_SIGNAL_KEYS = tuple(WEIGHTS)
+_FEATURE_COLUMNS = ("date",) + _SIGNAL_KEYS
+_SIGNAL_INDEX = {k: i for i, k in enumerate(_SIGNAL_KEYS)}
+# Bound method, looked up once: the driver loops call this per contribution.
+_driver_label = DRIVER_LABELS.get
+
+# Direction each signal contributes to risk: +1 = higher than baseline is
+# worse, -1 = lower is worse, 0 = any deviation is worse (abs of z).
+_SIGNAL_SIGNS = {
+    "sleep_hours": 0,
+    "sleep_quality": -1,
+    "activity_minutes": -1,
+    "mood_value": -1,
+    "typing_avg_interval_ms": 1,
+    "typing_std_ms": 1,
+    "typing_backspace_ratio": 1,
+    "typing_fragmentation": 1,
+    "voice_strain_score": 1,
+    "speech_sentiment_compound": -1,
+}
+_WEIGHT_VEC = np.array([WEIGHTS[k] for k in _SIGNAL_KEYS], dtype=np.float64)
+_SIGN_VEC = np.array([_SIGNAL_SIGNS[k] for k in _SIGNAL_KEYS], dtype=np.float64)
+_ABS_MASK = _SIGN_VEC == 0
+
+# Mean-centered x vectors for the momentum fits: the score windows are at
+# most TREND_DAYS+1 points, so every size the hot path needs is prebuilt.
+_X_CENTERED = {n: np.arange(n, dtype=np.float64) - (n - 1) / 2.0 for n in range(2, 16)}
+
+# Today-score and trend responses only change when a new summary lands or the
+# date rolls over, so cache them per user until shortly after midnight and
+# drop them whenever a day is (re)scored. In-process only: the SQLite
+# deployment runs single-process, so no shared cache backend is needed.
+_RESPONSE_CACHE: dict[tuple, tuple[float, Any]] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_MAX = 5000
+_RESPONSE_GRACE_SEC = 300
+
+
+def _cache_expiry() -> float:
+    midnight = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+    return midnight.timestamp() + _RESPONSE_GRACE_SEC
+
+
+def _cached_response(key: tuple) -> Optional[Any]:
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+    if entry is None or time.time() >= entry[0]:
+        return None
+    return entry[1]
+
+
+def _cache_response(key: tuple, value: Any) -> None:
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.clear()
+        _RESPONSE_CACHE[key] = (_cache_expiry(), value)
+
+
+# Bumped on every risk-score write; cross-user caches (org summary) key on it
+# so they refresh as soon as any user's score changes.
+_RISK_WRITE_VERSION = 0
+
+
+def risk_write_version() -> int:
+    return _RISK_WRITE_VERSION
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop cached score/trend responses after a user's data changes."""
+    global _RISK_WRITE_VERSION
+    with _RESPONSE_CACHE_LOCK:
+        _RISK_WRITE_VERSION += 1
+        for k in [k for k in _RESPONSE_CACHE if k[1] == user_id]:
+            del _RESPONSE_CACHE[k]
+
+
 def _get_daily_feature_rows(db: Session, user_id: str, from_date: date, to_date: date) -> list[dict]:
+    # Select scalar columns only: lightweight tuples, no ORM identity-map
+    # or per-object hydration cost for rows we immediately flatten.
     rows = (
-        db.query(DailySummary)
+        db.query(*(getattr(DailySummary, col) for col in _FEATURE_COLUMNS))
         .filter(
             DailySummary.user_id == user_id,
             DailySummary.date >= from_date,
@@ -51,22 +133,14 @@ def _get_daily_feature_rows(db: Session, user_id: str, from_date: date, to_date:
         .order_by(DailySummary.date)
         .all()
     )
-    out = []
-    for r in rows:
-        out.append({
-            "date": r.date,
-            "sleep_hours": r.sleep_hours,
-            "sleep_quality": r.sleep_quality,
-            "activity_minutes": r.activity_minutes,
-            "mood_value": r.mood_value,
-            "typing_avg_interval_ms": r.typing_avg_interval_ms,
-            "typing_std_ms": r.typing_std_ms,
-            "typing_backspace_ratio": r.typing_backspace_ratio,
-            "typing_fragmentation": r.typing_fragmentation,
-            "voice_strain_score": float(r.voice_strain_score) if r.voice_strain_score is not None else None,
-            "speech_sentiment_compound": float(r.speech_sentiment_compound) if r.speech_sentiment_compound is not None else None,
-        })
-    return out
+    # Columns are numeric already (the int voice score promotes in
+    # arithmetic), so no per-field float() round-trips are needed.
+    return [dict(zip(_FEATURE_COLUMNS, r)) for r in rows]
+
+
+def _row_to_dict(summary: DailySummary) -> dict:
+    """Flatten an ORM DailySummary to the feature dict the scorers consume."""
+    return {col: getattr(summary, col) for col in _FEATURE_COLUMNS}
 
 
 def _baseline_stats(rows: list[dict], baseline_days: int = DEFAULT_BASELINE_DAYS) -> dict[str, tuple[float, float]]:
@@ -74,58 +148,81 @@ def _baseline_stats(rows: list[dict], baseline_days: int = DEFAULT_BASELINE_DAYS
     if not rows or len(rows) < 2:
         return {}
     use = rows[: min(baseline_days, len(rows))]
-    stats = {}
-    for key in WEIGHTS:
-        vals = [r.get(key) for r in use if r.get(key) is not None]
-        if len(vals) < 2:
-            continue
-        arr = np.array(vals, dtype=float)
-        stats[key] = (float(np.mean(arr)), float(np.std(arr)) + EPS)
-    return stats
-
-
-def _z_score(value: Optional[float], mean: float, std: float) -> float:
-    if value is None or std <= 0:
-        return 0.0
-    return (value - mean) / std
-
-
-def _deviation_to_risk(z: float, signal: str) -> float:
-    """Map z-score to contribution to risk. For most signals: worse = higher z or lower value."""
-    # Sleep hours: optimal ~7-8; both low and high are bad -> use abs(z) or one-sided
-    if signal == "sleep_hours":
-        # assume mean ~7, so low sleep = negative z = bad; high sleep = positive z = can be bad too
-        return abs(z)
-    # Sleep quality, activity, mood, speech sentiment: higher is better -> negative z = worse
-    if signal in ("sleep_quality", "activity_minutes", "mood_value", "speech_sentiment_compound"):
-        return max(0, -z)
-    # Typing: higher interval, std, backspace ratio, fragmentation = worse
-    if signal in ("typing_avg_interval_ms", "typing_std_ms", "typing_backspace_ratio", "typing_fragmentation"):
-        return max(0, z)
-    # Voice strain: higher score = worse
-    if signal == "voice_strain_score":
-        return max(0, z)
-    return max(0, abs(z))
+    # One (days, signals) matrix with NaN for missing, then column-wise
+    # reductions instead of a Python list pass per signal.
+    mat = np.array(
+        [[r.get(k) if r.get(k) is not None else np.nan for k in _SIGNAL_KEYS] for r in use],
+        dtype=np.float64,
+    )
+    counts = np.sum(~np.isnan(mat), axis=0)
+    keep = counts >= 2
+    if not keep.any():
+        return {}
+    sub = mat[:, keep]
+    means = np.nanmean(sub, axis=0)
+    # nanstd would recompute the column means internally; reuse ours.
+    stds = np.sqrt(np.nanmean((sub - means) ** 2, axis=0)) + EPS
+    kept_keys = [k for k, f in zip(_SIGNAL_KEYS, keep) if f]
+    return {k: (float(m), float(s)) for k, m, s in zip(kept_keys, means, stds)}
+
+
+def _baseline_for(
+    db: Session, user_id: str, end_date: date, baseline_days: int = DEFAULT_BASELINE_DAYS
+) -> dict[str, tuple[float, float]]:
+    """Baseline stats for the window ending at `end_date`, memoized on the
+    session so repeat callers within one request skip the query and the
+    mean/std passes. Session.info lives exactly as long as the request."""
+    cache = db.info.setdefault("baseline_cache", {})
+    key = (user_id, end_date, baseline_days)
+    if key not in cache:
+        start_date = end_date - timedelta(days=baseline_days + 30)
+        rows = _get_daily_feature_rows(db, user_id, start_date, end_date)
+        cache[key] = _baseline_stats(rows, baseline_days) if rows else {}
+    return cache[key]
 
 
 def _weighted_risk(day_row: dict, baseline: dict[str, tuple[float, float]]) -> tuple[float, list[str], list[tuple[str, float]]]:
     """Returns (raw_risk_0_to_1, list of top driver keys, list of (key, contribution) tuples)."""
-    contributions = []
+    # Evaluate all signals in one fixed-order vector pass: z-scores, the
+    # per-signal direction branches, and the weighting collapse to a few
+    # NumPy ops instead of per-key Python dispatch in the per-day hot path.
+    n = len(_SIGNAL_KEYS)
+    vals = np.full(n, np.nan)
+    means = np.zeros(n)
+    stds = np.zeros(n)
     for key, (mean, std) in baseline.items():
         val = day_row.get(key)
         if val is None:
             continue
-        z = _z_score(val, mean, std)
-        contrib = _deviation_to_risk(z, key) * WEIGHTS.get(key, 0)
-        contributions.append((key, contrib))
-    contributions.sort(key=lambda x: -x[1])
-    total = sum(c[1] for c in contributions)
+        i = _SIGNAL_INDEX[key]
+        vals[i] = val
+        means[i] = mean
+        stds[i] = std
+    present = ~np.isnan(vals)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (vals - means) / stds
+    risk = np.where(_ABS_MASK, np.abs(z), np.maximum(0.0, _SIGN_VEC * z))
+    contrib = np.where(present & (stds > 0), risk * _WEIGHT_VEC, 0.0)
+    idx = np.flatnonzero(present)
+    total = float(contrib[idx].sum())
+    # Only the top 3 need ordering, so partition instead of sorting all
+    # present signals; callers slice [:3] and otherwise just sum.
+    k = min(3, idx.size)
+    if 0 < k < idx.size:
+        top = idx[np.argpartition(-contrib[idx], k - 1)[:k]]
+    else:
+        top = idx
+    top = top[np.argsort(-contrib[top], kind="stable")]
+    top_set = set(top.tolist())
+    contributions = [(_SIGNAL_KEYS[i], float(contrib[i])) for i in top]
+    contributions.extend((_SIGNAL_KEYS[i], float(contrib[i])) for i in idx if i not in top_set)
     # Normalize to 0-1 ish; cap and scale to 0-100 as "risk", then we use 100 - risk as wellbeing
     raw_risk = min(1.0, total * 2.0)  # scale so typical drift gives 0.2-0.6
-    drivers = [c[0] for c in contributions[:3] if c[1] > 0.05]
+    drivers = [_SIGNAL_KEYS[i] for i in top if contrib[i] > 0.05]
     return raw_risk, drivers, contributions
 
 
+@lru_cache(maxsize=1024)
 def _wellbeing_and_status(risk_0_1: float) -> tuple[float, str]:
     """Map risk [0,1] to wellbeing score 0-100 and status."""
     wellbeing = (1.0 - risk_0_1) * 100.0
@@ -139,52 +236,64 @@ def _wellbeing_and_status(risk_0_1: float) -> tuple[float, str]:
     return round(wellbeing, 1), status
 
 
-def _first_day_wellbeing(day_row: dict) -> tuple[float, str, list[str]]:
-    """When there's no baseline yet, score from today's check-in only. Returns (wellbeing 0-100, status, drivers)."""
-    drivers = []
-    parts = []
+def _norm_mood(mood: float) -> float:
     # Mood 1–10 scale (higher = better)
-    mood = day_row.get("mood_value")
-    if mood is not None:
-        p = (float(mood) - 1) / 9.0 * 100.0
-        parts.append(max(0, min(100, p)))
-        drivers.append("mood_value")
+    return max(0, min(100, (float(mood) - 1) / 9.0 * 100.0))
+
+
+def _norm_sleep_quality(sq: float) -> float:
     # Sleep quality 1-5 -> 20-100
-    sq = day_row.get("sleep_quality")
-    if sq is not None:
-        p = (sq - 1) / 4.0 * 80.0 + 20.0
-        parts.append(max(0, min(100, p)))
-        drivers.append("sleep_quality")
+    return max(0, min(100, (sq - 1) / 4.0 * 80.0 + 20.0))
+
+
+def _norm_sleep_hours(sh: float) -> float:
     # Sleep hours: 7 optimal, penalty for <6 or >9
-    sh = day_row.get("sleep_hours")
-    if sh is not None:
-        if sh < 5:
-            p = 20.0
-        elif sh < 6:
-            p = 50.0
-        elif sh <= 9:
-            p = 70.0 + (4.0 - abs(sh - 7.5)) * 7.5
-        else:
-            p = max(40, 80 - (sh - 9) * 10)
-        parts.append(max(0, min(100, p)))
-        drivers.append("sleep_hours")
+    if sh < 5:
+        p = 20.0
+    elif sh < 6:
+        p = 50.0
+    elif sh <= 9:
+        p = 70.0 + (4.0 - abs(sh - 7.5)) * 7.5
+    else:
+        p = max(40, 80 - (sh - 9) * 10)
+    return max(0, min(100, p))
+
+
+def _norm_activity(act: float) -> float:
     # Activity 0-60+ min -> 0-100 (capped)
-    act = day_row.get("activity_minutes")
-    if act is not None:
-        p = min(100, act / 60.0 * 100.0)
-        parts.append(p)
-        drivers.append("activity_minutes")
+    return min(100, act / 60.0 * 100.0)
+
+
+def _norm_voice_strain(vs: float) -> float:
     # Voice strain 0-100: higher score = more strain = worse -> invert to wellbeing
-    vs = day_row.get("voice_strain_score")
-    if vs is not None:
-        parts.append(max(0, 100 - float(vs)))
-        drivers.append("voice_strain_score")
+    return max(0, 100 - float(vs))
+
+
+def _norm_sentiment(ssc: float) -> float:
     # Speech sentiment compound -1..1 -> 0-100 (higher = better)
-    ssc = day_row.get("speech_sentiment_compound")
-    if ssc is not None:
-        p = (float(ssc) + 1) / 2.0 * 100.0
-        parts.append(max(0, min(100, p)))
-        drivers.append("speech_sentiment_compound")
+    return max(0, min(100, (float(ssc) + 1) / 2.0 * 100.0))
+
+
+# (signal, normalizer) in driver-priority order for the no-baseline path.
+_FIRST_DAY_NORMS = (
+    ("mood_value", _norm_mood),
+    ("sleep_quality", _norm_sleep_quality),
+    ("sleep_hours", _norm_sleep_hours),
+    ("activity_minutes", _norm_activity),
+    ("voice_strain_score", _norm_voice_strain),
+    ("speech_sentiment_compound", _norm_sentiment),
+)
+
+
+def _first_day_wellbeing(day_row: dict) -> tuple[float, str, list[str]]:
+    """When there's no baseline yet, score from today's check-in only. Returns (wellbeing 0-100, status, drivers)."""
+    drivers = []
+    parts = []
+    for key, norm in _FIRST_DAY_NORMS:
+        val = day_row.get(key)
+        if val is not None:
+            parts.append(norm(val))
+            drivers.append(key)
     if not parts:
         return 50.0, "Watch", []
     wellbeing = round(sum(parts) / len(parts), 1)
@@ -198,13 +307,30 @@ def _first_day_wellbeing(day_row: dict) -> tuple[float, str, list[str]]:
     return wellbeing, status, drivers[:3]
 
 
+def _slope_intercept(scores: list[float]) -> tuple[float, float]:
+    """Least-squares line through (0..n-1, scores), in closed form.
+
+    Equivalent to np.polyfit(x, y, 1) for a degree-1 fit but O(n) — no
+    Vandermonde matrix or lstsq call. With x = 0..n-1 the denominator is
+    n*(n^2-1)/12 symbolically.
+    """
+    n = len(scores)
+    y = np.asarray(scores, dtype=np.float64)
+    x_mean = (n - 1) / 2.0
+    y_mean = y.mean()
+    x_centered = _X_CENTERED.get(n)
+    if x_centered is None:
+        x_centered = np.arange(n, dtype=np.float64) - x_mean
+    num = np.dot(x_centered, y - y_mean)
+    slope = num * 12.0 / (n * (n * n - 1))
+    return slope, y_mean - slope * x_mean
+
+
 def _momentum(scores: list[float]) -> str:
     """scores ordered by date ascending (oldest first). Return stable / slow_rise / rapid_rise."""
     if len(scores) < 2:
         return "stable"
-    x = np.arange(len(scores))
-    y = np.array(scores)
-    slope, _ = np.polyfit(x, y, 1)
+    slope, _ = _slope_intercept(scores)
     # wellbeing going down = risk rising
     if slope <= -2:
         return "rapid_rise"
@@ -237,10 +363,8 @@ def _compute_momentum_label_and_strength(scores: list[float]) -> tuple[str, Opti
             return "Stable", None
     
     # For 3+ data points, use linear regression
-    x = np.arange(len(scores))
-    y = np.array(scores)
-    slope, _ = np.polyfit(x, y, 1)
-    
+    slope, _ = _slope_intercept(scores)
+
     # Lower threshold: 0.8 points per day (more sensitive to changes)
     # Positive slope = wellbeing improving = Recovering
     # Negative slope = wellbeing declining = Rising
@@ -266,6 +390,45 @@ def _confidence(n_baseline: int, missing_count: int) -> str:
     return "med"
 
 
+def _compute_risk_fields(
+    day_row: dict,
+    baseline: dict[str, tuple[float, float]],
+    recent_scores: list[float],
+    baseline_days: int = DEFAULT_BASELINE_DAYS,
+) -> dict[str, Any]:
+    """Pure scoring core: no DB access. `recent_scores` are the trailing
+    wellbeing scores before this day, ordered ascending."""
+    if not baseline:
+        # First day(s): no baseline yet, score from today's check-in only
+        wellbeing, status, drivers = _first_day_wellbeing(day_row)
+        confidence = "low"
+    else:
+        risk_0_1, drivers, _ = _weighted_risk(day_row, baseline)
+        wellbeing, status = _wellbeing_and_status(risk_0_1)
+        missing = sum(1 for k in WEIGHTS if day_row.get(k) is None)
+        confidence = _confidence(baseline_days, missing)
+
+    momentum = _momentum(recent_scores + [wellbeing])
+    return {
+        "wellbeing_score": wellbeing,
+        "status": status,
+        "momentum": momentum,
+        "confidence": confidence,
+        "drivers": drivers,
+    }
+
+
+def _input_hash(
+    day_row: dict,
+    baseline: dict[str, tuple[float, float]],
+    recent_scores: list[float],
+) -> str:
+    """Short digest of everything the score depends on. Dict reprs are
+    deterministic here: both dicts are built in fixed signal order."""
+    payload = repr((day_row, baseline, recent_scores)).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
 def compute_risk_for_date(
     db: Session,
     user_id: str,
@@ -281,65 +444,9 @@ def compute_risk_for_date(
     )
     if not summary:
         return None
-    day_row = {
-        "date": target_date,
-        "sleep_hours": summary.sleep_hours,
-        "sleep_quality": summary.sleep_quality,
-        "activity_minutes": summary.activity_minutes,
-        "mood_value": summary.mood_value,
-        "typing_avg_interval_ms": summary.typing_avg_interval_ms,
-        "typing_std_ms": summary.typing_std_ms,
-        "typing_backspace_ratio": summary.typing_backspace_ratio,
-        "typing_fragmentation": summary.typing_fragmentation,
-        "voice_strain_score": float(summary.voice_strain_score) if summary.voice_strain_score is not None else None,
-        "speech_sentiment_compound": float(summary.speech_sentiment_compound) if summary.speech_sentiment_compound is not None else None,
-    }
-    end_baseline = target_date - timedelta(days=1)
-    start_baseline = end_baseline - timedelta(days=baseline_days + 30)
-    all_rows = _get_daily_feature_rows(db, user_id, start_baseline, end_baseline)
-    baseline = _baseline_stats(all_rows, baseline_days) if all_rows else {}
+    day_row = _row_to_dict(summary)
+    baseline = _baseline_for(db, user_id, target_date - timedelta(days=1), baseline_days)
 
-    driver_contributions_list = []
-    if not baseline:
-        # First day(s): no baseline yet, score from today's check-in only
-        wellbeing, status, drivers = _first_day_wellbeing(day_row)
-        confidence = "low"
-    else:
-        risk_0_1, drivers, contributions = _weighted_risk(day_row, baseline)
-        wellbeing, status = _wellbeing_and_status(risk_0_1)
-        missing = sum(1 for k in WEIGHTS if day_row.get(k) is None)
-        confidence = _confidence(baseline_days, missing)
-        
-        # Calculate driver contributions for display
-        # Get previous day's score for comparison
-        prev_score_row = (
-            db.query(RiskScore)
-            .filter(
-                RiskScore.user_id == user_id,
-                RiskScore.date < target_date,
-            )
-            .order_by(RiskScore.date.desc())
-            .first()
-        )
-        prev_wellbeing = prev_score_row.wellbeing_score if prev_score_row else wellbeing
-        
-        # Calculate contribution: how much each driver affects the score change
-        score_delta = wellbeing - prev_wellbeing
-        total_contrib_abs = sum(abs(c[1]) for c in contributions)
-        if total_contrib_abs > 0 and abs(score_delta) > 0.1:
-            for key, contrib in contributions[:3]:
-                if contrib > 0.01:  # Only significant contributions
-                    # Contribution as percentage of score change
-                    contrib_pct = (contrib / total_contrib_abs) * abs(score_delta) if total_contrib_abs > 0 else 0
-                    # Determine direction: if contrib increases risk, it decreases wellbeing
-                    direction = "up" if contrib > 0 else "down"
-                    driver_contributions_list.append({
-                        "key": key,
-                        "label": DRIVER_LABELS.get(key, key),
-                        "direction": direction,
-                        "contribution": round(contrib_pct, 1)
-                    })
-    
     # Momentum from last TREND_DAYS wellbeing scores
     score_rows = (
         db.query(RiskScore)
@@ -352,19 +459,42 @@ def compute_risk_for_date(
         .all()
     )
     recent_scores = [s.wellbeing_score for s in score_rows]
-    momentum = _momentum(recent_scores + [wellbeing])
     existing = (
         db.query(RiskScore)
         .filter(RiskScore.user_id == user_id, RiskScore.date == target_date)
         .first()
     )
+    inputs_digest = _input_hash(day_row, baseline, recent_scores)
+    if existing is not None and existing.input_hash == inputs_digest:
+        # Same inputs as last time (page refresh, re-submitted check-in):
+        # skip the scoring and the write transaction entirely.
+        existing._recent_scores = recent_scores
+        return existing
+    fields = _compute_risk_fields(day_row, baseline, recent_scores, baseline_days)
+    wellbeing = fields["wellbeing_score"]
+    status = fields["status"]
+    momentum = fields["momentum"]
+    confidence = fields["confidence"]
+    drivers = fields["drivers"]
+    # Stamp the label/strength now: they are a pure function of the stored
+    # history, so read paths can serve them without re-running the fit.
+    momentum_label, momentum_strength = _compute_momentum_label_and_strength(
+        recent_scores + [wellbeing]
+    )
     if existing:
         existing.wellbeing_score = wellbeing
         existing.status = status
         existing.momentum = momentum
         existing.confidence = confidence
         existing.drivers = drivers
+        existing.momentum_label = momentum_label
+        existing.momentum_strength = momentum_strength
+        existing.input_hash = inputs_digest
         db.commit()
+        invalidate_user_cache(user_id)
+        # Transient, not persisted: lets get_today_score reuse the momentum
+        # window fetched above instead of re-querying the same range.
+        existing._recent_scores = recent_scores
         return existing
     risk_ent = RiskScore(
         user_id=user_id,
@@ -374,25 +504,155 @@ def compute_risk_for_date(
         momentum=momentum,
         confidence=confidence,
         drivers=drivers,
+        momentum_label=momentum_label,
+        momentum_strength=momentum_strength,
+        input_hash=inputs_digest,
     )
     db.add(risk_ent)
     db.commit()
+    invalidate_user_cache(user_id)
     db.refresh(risk_ent)
+    risk_ent._recent_scores = recent_scores
     return risk_ent
 
 
+# Recomputes queued but not yet run, so bursts of events (typing batches)
+# coalesce into one background task per user and day.
+_PENDING_RECOMPUTE: set[tuple[str, date]] = set()
+_PENDING_RECOMPUTE_LOCK = threading.Lock()
+
+
+def recompute_risk_task(user_id: str, target_date: date) -> None:
+    """Background-task entry point: runs compute_risk_for_date on its own
+    session, after the response has gone out."""
+    with _PENDING_RECOMPUTE_LOCK:
+        _PENDING_RECOMPUTE.discard((user_id, target_date))
+    from app.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        compute_risk_for_date(db, user_id, target_date)
+    finally:
+        db.close()
+
+
+def schedule_risk_recompute(background, user_id: str, target_date: date) -> None:
+    """Queue a debounced risk recompute on FastAPI BackgroundTasks. A second
+    call for the same user and day while one is pending is a no-op."""
+    with _PENDING_RECOMPUTE_LOCK:
+        if (user_id, target_date) in _PENDING_RECOMPUTE:
+            return
+        _PENDING_RECOMPUTE.add((user_id, target_date))
+    background.add_task(recompute_risk_task, user_id, target_date)
+
+
+def compute_risk_range(db: Session, user_id: str, start_date: date, end_date: date) -> dict[date, RiskScore]:
+    """Score every day in [start_date, end_date] that has a DailySummary but
+    no stored RiskScore yet, from one bulk fetch per table and a single
+    commit — instead of per-day queries and write transactions.
+
+    Existing rows get the same input_hash staleness check that
+    compute_risk_for_date performs: if a day's inputs changed since it was
+    stamped (e.g. a backfilled prior day landed in its momentum window), it
+    is rescored in place instead of serving the stale stored label.
+
+    Returns date -> RiskScore for all stored scores up to end_date, including
+    the newly backfilled days.
+    """
+    # Feature window wide enough to cover every day's baseline lookback
+    feature_start = start_date - timedelta(days=DEFAULT_BASELINE_DAYS + 31)
+    feature_rows = _get_daily_feature_rows(db, user_id, feature_start, end_date)
+    rows_by_date = {r["date"]: r for r in feature_rows}
+    score_rows = (
+        db.query(RiskScore)
+        .filter(RiskScore.user_id == user_id, RiskScore.date <= end_date)
+        .order_by(RiskScore.date)
+        .all()
+    )
+    by_date = {r.date: r for r in score_rows}
+    wellbeing_by_date = {r.date: r.wellbeing_score for r in score_rows}
+    changed = 0
+    td = timedelta
+    for d in range((end_date - start_date).days + 1):
+        dte = start_date + td(days=d)
+        day_row = rows_by_date.get(dte)
+        if not day_row:
+            # No summary for this day: nothing to score, and an existing row
+            # without one (seeded data) has no inputs to recheck.
+            continue
+        existing = by_date.get(dte)
+        if existing is not None and existing.input_hash is None:
+            # Row predates the input_hash column; get_trends already falls
+            # back to the live momentum fit for these, so leave it alone.
+            continue
+        baseline_rows = [
+            rows_by_date[bd]
+            for bd in (dte - td(days=i) for i in range(DEFAULT_BASELINE_DAYS + 31, 0, -1))
+            if bd in rows_by_date
+        ]
+        baseline = _baseline_stats(baseline_rows) if baseline_rows else {}
+        recent_scores = [
+            wellbeing_by_date[sd]
+            for sd in (dte - td(days=i) for i in range(TREND_DAYS, 0, -1))
+            if sd in wellbeing_by_date
+        ]
+        inputs_digest = _input_hash(day_row, baseline, recent_scores)
+        if existing is not None and existing.input_hash == inputs_digest:
+            continue
+        fields = _compute_risk_fields(day_row, baseline, recent_scores)
+        momentum_label, momentum_strength = _compute_momentum_label_and_strength(
+            recent_scores + [fields["wellbeing_score"]]
+        )
+        if existing is not None:
+            existing.wellbeing_score = float(fields["wellbeing_score"])
+            existing.status = fields["status"]
+            existing.momentum = fields["momentum"]
+            existing.confidence = fields["confidence"]
+            existing.drivers = fields["drivers"]
+            existing.momentum_label = momentum_label
+            existing.momentum_strength = momentum_strength
+            existing.input_hash = inputs_digest
+            r = existing
+        else:
+            r = RiskScore(
+                user_id=user_id,
+                date=dte,
+                wellbeing_score=float(fields["wellbeing_score"]),
+                status=fields["status"],
+                momentum=fields["momentum"],
+                confidence=fields["confidence"],
+                drivers=fields["drivers"],
+                momentum_label=momentum_label,
+                momentum_strength=momentum_strength,
+                input_hash=inputs_digest,
+            )
+            db.add(r)
+            by_date[dte] = r
+        changed += 1
+        wellbeing_by_date[dte] = r.wellbeing_score
+    if changed:
+        db.commit()
+        invalidate_user_cache(user_id)
+    return by_date
+
+
 def get_today_score(db: Session, user_id: str) -> Optional[dict]:
     """Get or compute today's score for user. Returns dict for API."""
     today = date.today()
-    
-    # First check if we have a DailySummary for today (required for score computation)
-    has_checkin_today = (
+    cache_key = ("today", user_id, today)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    # One DailySummary fetch serves the check-in gate, the driver
+    # contributions, and the voice fields below.
+    summary = (
         db.query(DailySummary)
         .filter(DailySummary.user_id == user_id, DailySummary.date == today)
-        .first() is not None
+        .first()
     )
-    
-    if not has_checkin_today:
+
+    if summary is None:
         # No check-in today, return None
         return None
     
@@ -407,17 +667,23 @@ def get_today_score(db: Session, user_id: str) -> Optional[dict]:
     
     # Compute momentum_label and momentum_strength from recent scores
     # Always compute if we have at least 2 scores (even if confidence is low)
-    score_rows = (
-        db.query(RiskScore)
-        .filter(
-            RiskScore.user_id == user_id,
-            RiskScore.date >= today - timedelta(days=TREND_DAYS),
-            RiskScore.date <= today,
+    prior_scores = getattr(r, "_recent_scores", None)
+    if prior_scores is not None:
+        # compute_risk_for_date just scored today and already fetched the
+        # trailing window; append today's score instead of re-querying it.
+        recent_scores = prior_scores + [r.wellbeing_score]
+    else:
+        score_rows = (
+            db.query(RiskScore)
+            .filter(
+                RiskScore.user_id == user_id,
+                RiskScore.date >= today - timedelta(days=TREND_DAYS),
+                RiskScore.date <= today,
+            )
+            .order_by(RiskScore.date)
+            .all()
         )
-        .order_by(RiskScore.date)
-        .all()
-    )
-    recent_scores = [s.wellbeing_score for s in score_rows]
+        recent_scores = [s.wellbeing_score for s in score_rows]
     current_score = r.wellbeing_score
     
     # Special handling: if status is "High" and score is very low, default to "Rising"
@@ -459,7 +725,10 @@ def get_today_score(db: Session, user_id: str) -> Optional[dict]:
             momentum_label, momentum_strength = "Stable", None
     else:
         # Normal status or Watch with score >= 45 - use standard calculation
-        if len(recent_scores) >= 2:
+        if r.momentum_label is not None:
+            # Stamped at write time from the same trailing window
+            momentum_label, momentum_strength = r.momentum_label, r.momentum_strength
+        elif len(recent_scores) >= 2:
             momentum_label, momentum_strength = _compute_momentum_label_and_strength(recent_scores)
         else:
             momentum_label, momentum_strength = "Stable", None
@@ -467,36 +736,15 @@ def get_today_score(db: Session, user_id: str) -> Optional[dict]:
     # Compute driver contributions - show top 3 drivers with their impact
     driver_contributions = []
     if r.drivers:
-        # Get today's daily summary to compute contributions
-        summary = (
-            db.query(DailySummary)
-            .filter(DailySummary.user_id == user_id, DailySummary.date == today)
-            .first()
-        )
         if summary:
             # Compute contributions using baseline
-            end_baseline = today - timedelta(days=1)
-            start_baseline = end_baseline - timedelta(days=DEFAULT_BASELINE_DAYS + 30)
-            all_rows = _get_daily_feature_rows(db, user_id, start_baseline, end_baseline)
-            baseline = _baseline_stats(all_rows, DEFAULT_BASELINE_DAYS) if all_rows else {}
-            
+            baseline = _baseline_for(db, user_id, today - timedelta(days=1))
+
             if baseline:
-                day_row = {
-                    "sleep_hours": summary.sleep_hours,
-                    "sleep_quality": summary.sleep_quality,
-                    "activity_minutes": summary.activity_minutes,
-                    "mood_value": summary.mood_value,
-                    "typing_avg_interval_ms": summary.typing_avg_interval_ms,
-                    "typing_std_ms": summary.typing_std_ms,
-                    "typing_backspace_ratio": summary.typing_backspace_ratio,
-                    "typing_fragmentation": summary.typing_fragmentation,
-                    "voice_strain_score": float(summary.voice_strain_score) if summary.voice_strain_score is not None else None,
-                    "speech_sentiment_compound": float(summary.speech_sentiment_compound) if summary.speech_sentiment_compound is not None else None,
-                }
-                _, _, contributions = _weighted_risk(day_row, baseline)
+                _, _, contributions = _weighted_risk(_row_to_dict(summary), baseline)
                 
                 # Get previous score for comparison to show direction
-                prev_score = score_rows[-2].wellbeing_score if len(score_rows) >= 2 else r.wellbeing_score
+                prev_score = recent_scores[-2] if len(recent_scores) >= 2 else r.wellbeing_score
                 score_delta = r.wellbeing_score - prev_score
                 
                 # Calculate contribution as percentage impact on score
@@ -511,24 +759,19 @@ def get_today_score(db: Session, user_id: str) -> Optional[dict]:
                             direction = "up" if contrib > 0 else "down"
                             driver_contributions.append({
                                 "key": key,
-                                "label": DRIVER_LABELS.get(key, key),
+                                "label": _driver_label(key, key),
                                 "direction": direction,
                                 "contribution": round(contrib_pct, 1)
                             })
     
     # Voice strain (from daily summary if present)
-    summary_today = (
-        db.query(DailySummary)
-        .filter(DailySummary.user_id == user_id, DailySummary.date == today)
-        .first()
-    )
-    voice_strain_score = summary_today.voice_strain_score if summary_today else None
-    voice_strain_level = summary_today.voice_strain_level if summary_today else None
-    voice_confidence = summary_today.voice_confidence if summary_today else None
-    speech_sentiment_compound = summary_today.speech_sentiment_compound if summary_today else None
-    speech_sentiment_label = summary_today.speech_sentiment_label if summary_today else None
+    voice_strain_score = summary.voice_strain_score
+    voice_strain_level = summary.voice_strain_level
+    voice_confidence = summary.voice_confidence
+    speech_sentiment_compound = summary.speech_sentiment_compound
+    speech_sentiment_label = summary.speech_sentiment_label
 
-    return {
+    result = {
         "wellbeing_score": r.wellbeing_score,
         "status": r.status,
         "momentum": r.momentum,
@@ -544,46 +787,56 @@ def get_today_score(db: Session, user_id: str) -> Optional[dict]:
         "speech_sentiment_compound": speech_sentiment_compound,
         "speech_sentiment_label": speech_sentiment_label,
     }
+    _cache_response(cache_key, result)
+    return result
+
 
+def get_trends(db: Session, user_id: str, days: int = 14, fill_missing: bool = True) -> dict:
+    """Get wellbeing scores for the last `days` days (including today) plus projection.
 
-def get_trends(db: Session, user_id: str, days: int = 14) -> dict:
-    """Get wellbeing scores for the last `days` days (including today) plus projection."""
+    With fill_missing=False this is a pure read: days without a stored
+    RiskScore are skipped instead of scored and persisted, so callers that
+    only aggregate (or that run under heavy concurrency) avoid turning a
+    GET into a write transaction.
+    """
     end = date.today()
+    cache_key = ("trends", user_id, end, days, fill_missing)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
     start = end - timedelta(days=days - 1)
-    rows = (
-        db.query(RiskScore)
-        .filter(
-            RiskScore.user_id == user_id,
-            RiskScore.date >= start,
-            RiskScore.date <= end,
+    if fill_missing:
+        by_date = compute_risk_range(db, user_id, start, end)
+    else:
+        score_rows = (
+            db.query(RiskScore)
+            .filter(RiskScore.user_id == user_id, RiskScore.date <= end)
+            .order_by(RiskScore.date)
+            .all()
         )
-        .order_by(RiskScore.date)
-        .all()
-    )
-    # Fill missing days by computing
+        by_date = {r.date: r for r in score_rows}
+    wellbeing_by_date = {d: r.wellbeing_score for d, r in by_date.items()}
     result = []
     all_scores = []
+    # Local bindings for names resolved on every loop iteration
+    td = timedelta
     for d in range(days):
-        dte = start + timedelta(days=d)
-        r = next((x for x in rows if x.date == dte), None)
-        if not r:
-            r = compute_risk_for_date(db, user_id, dte)
+        dte = start + td(days=d)
+        r = by_date.get(dte)
         if r:
             all_scores.append(r.wellbeing_score)
-            # Compute momentum_label for this date
-            date_scores = (
-                db.query(RiskScore)
-                .filter(
-                    RiskScore.user_id == user_id,
-                    RiskScore.date >= dte - timedelta(days=TREND_DAYS),
-                    RiskScore.date <= dte,
-                )
-                .order_by(RiskScore.date)
-                .all()
-            )
-            recent_scores = [s.wellbeing_score for s in date_scores]
-            momentum_label, momentum_strength = _compute_momentum_label_and_strength(recent_scores)
-            
+            if r.momentum_label is not None:
+                momentum_label, momentum_strength = r.momentum_label, r.momentum_strength
+            else:
+                # Row predates the stamped columns: momentum label from the
+                # trailing window, sliced from the prefetched score map.
+                recent_scores = [
+                    wellbeing_by_date[sd]
+                    for sd in (dte - td(days=i) for i in range(TREND_DAYS, -1, -1))
+                    if sd in wellbeing_by_date
+                ]
+                momentum_label, momentum_strength = _compute_momentum_label_and_strength(recent_scores)
+
             result.append({
                 "date": r.date.isoformat(),
                 "wellbeing_score": r.wellbeing_score,
@@ -597,28 +850,31 @@ def get_trends(db: Session, user_id: str, days: int = 14) -> dict:
     # Add projection if we have at least 2 data points
     projection = []
     if len(all_scores) >= 2 and len(result) > 0:
-        # Compute slope from last 7 days
-        recent_scores = all_scores[-7:] if len(all_scores) >= 7 else all_scores
-        x = np.arange(len(recent_scores))
-        y = np.array(recent_scores)
-        slope, intercept = np.polyfit(x, y, 1)
-        
+        # Compute slope from last 7 days (slicing handles shorter histories)
+        recent_scores = all_scores[-7:]
+        slope, intercept = _slope_intercept(recent_scores)
+
         # Project forward 5 days starting from the last actual date
         last_actual_date = result[-1]["date"]
         # Parse ISO date string back to date object
         last_date_obj = date.fromisoformat(last_actual_date) if isinstance(last_actual_date, str) else last_actual_date
-        
-        for i in range(1, 6):
-            proj_date = last_date_obj + timedelta(days=i)
-            # Project score: intercept + slope * (number of days from start of recent_scores)
-            proj_score = intercept + slope * (len(recent_scores) - 1 + i)
-            proj_score = max(0, min(100, proj_score))
-            projection.append({
-                "date": proj_date.isoformat(),
-                "projected_score": round(proj_score, 1)
-            })
+
+        # Extend the fitted line for all 5 days in one vector expression;
+        # the clamp stays Python-side to keep the exact response values
+        # (including the bare 0/100 ints) the endpoint has always returned.
+        offsets = np.arange(len(recent_scores), len(recent_scores) + 5)
+        proj_scores = intercept + slope * offsets
+        projection = [
+            {
+                "date": (last_date_obj + timedelta(days=i + 1)).isoformat(),
+                "projected_score": round(max(0, min(100, float(proj_scores[i]))), 1),
+            }
+            for i in range(5)
+        ]
     
-    return {
+    response = {
         "data": result,
         "projection": projection
     }
+    _cache_response(cache_key, response)
+    return response
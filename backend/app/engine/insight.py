@@ -1,4 +1,5 @@
 """Template-based insight generator from drivers."""
+import random
 from typing import Any
 
 DRIVER_LABELS = {
@@ -35,7 +36,6 @@ def generate_insight(drivers: list[str], status: str) -> dict[str, Any]:
     """Generate short_insight, drivers (human labels), suggested_actions (1-2)."""
     driver_str = _format_drivers(drivers)
     has_have = "has" if len(drivers) <= 1 else "have"
-    import random
     template = random.choice(TEMPLATES)
     short_insight = template.format(drivers=driver_str, has_have=has_have)
     driver_labels = [DRIVER_LABELS.get(d, d) for d in drivers]
@@ -1,4 +1,5 @@
 """Micro-interventions: map drivers to actions and track completion."""
+import hashlib
 from datetime import date
 from typing import Any, Optional
 
@@ -6,25 +7,28 @@ from sqlalchemy.orm import Session
 
 from app.models import Intervention
 
-# Expanded list of small steps/interventions for caregivers
-ALL_INTERVENTIONS = [
-    # Sleep-related
+# Small steps/interventions for caregivers, grouped by theme. The groups
+# double as a retrieval index: drivers map to their themes so the AI prompt
+# only carries the relevant slice, not the whole pool.
+_SLEEP_ACTIONS = [
     "Pick one night for a hard cutoff, 30 minutes earlier.",
     "Wind down 20 minutes before bed. No screens.",
     "Try a 5-minute bedtime routine: dim lights, gentle music, or reading.",
     "Set a consistent wake time, even on weekends.",
     "Keep your phone out of the bedroom tonight.",
     "Take a warm shower or bath 1 hour before bed.",
-    
-    # Activity/Movement
+]
+
+_ACTIVITY_ACTIONS = [
     "5-minute walk around the block.",
     "Do 3 gentle stretches right now.",
     "Stand up and move for 2 minutes every hour.",
     "Take the stairs instead of the elevator today.",
     "Dance to one favorite song.",
     "Step outside for fresh air and 10 deep breaths.",
-    
-    # Mood/Mental health
+]
+
+_MOOD_ACTIONS = [
     "3-minute brain dump: write down what's on your mind.",
     "60-second breathing reset: inhale 4, hold 4, exhale 4.",
     "Name 3 things you're grateful for today.",
@@ -33,16 +37,18 @@ ALL_INTERVENTIONS = [
     "Do one small thing that brings you joy.",
     "Practice a 2-minute mindfulness exercise.",
     "Write down one positive moment from today.",
-    
-    # Stress/Overwhelm
+]
+
+_STRESS_ACTIONS = [
     "Take a 5-minute break. Step away from caregiving tasks.",
     "Drink a glass of water and pause.",
     "Close your eyes and count to 10 slowly.",
     "Do one thing at a time. Prioritize what matters most.",
     "Ask for help with one task today.",
     "Set a timer for 15 minutes and do something just for you.",
-    
-    # General wellbeing
+]
+
+_GENERAL_ACTIONS = [
     "Take a short break when you can.",
     "Eat one nutritious meal or snack today.",
     "Connect with another caregiver or support person.",
@@ -51,6 +57,41 @@ ALL_INTERVENTIONS = [
     "Celebrate one small win from today.",
 ]
 
+ALL_INTERVENTIONS = (
+    _SLEEP_ACTIONS + _ACTIVITY_ACTIONS + _MOOD_ACTIONS + _STRESS_ACTIONS + _GENERAL_ACTIONS
+)
+
+# Which themed pools a driver should pull from when shortlisting.
+_POOLS_BY_DRIVER = {
+    "sleep_hours": _SLEEP_ACTIONS,
+    "sleep_quality": _SLEEP_ACTIONS,
+    "activity_minutes": _ACTIVITY_ACTIONS,
+    "mood_value": _MOOD_ACTIONS,
+    "typing_avg_interval_ms": _STRESS_ACTIONS,
+    "typing_std_ms": _STRESS_ACTIONS,
+    "typing_backspace_ratio": _STRESS_ACTIONS,
+    "typing_fragmentation": _STRESS_ACTIONS,
+    "voice_strain_score": _STRESS_ACTIONS,
+}
+
+
+def shortlist_for_drivers(drivers: list[str]) -> list[str]:
+    """Driver-relevant interventions plus the general pool, in stable order.
+
+    Keeps the AI selection prompt at a themed shortlist instead of the full
+    pool; with no recognized drivers the mood pool stands in so there is
+    always something specific to choose from.
+    """
+    pools = []
+    for d in drivers[:3]:
+        pool = _POOLS_BY_DRIVER.get(d)
+        if pool is not None and pool not in pools:
+            pools.append(pool)
+    if not pools:
+        pools.append(_MOOD_ACTIONS)
+    pools.append(_GENERAL_ACTIONS)
+    return [a for pool in pools for a in pool]
+
 # Legacy mapping for fallback (when AI not available)
 ACTIONS_BY_DRIVER = {
     "sleep_hours": "Pick one night for a hard cutoff, 30 minutes earlier.",
@@ -65,6 +106,22 @@ ACTIONS_BY_DRIVER = {
 }
 
 
+# Stable 8-char ID prefix per known action, hashed once at import; the pool is
+# static so request handlers should not re-run md5 per action.
+_ACTION_HASH = {
+    a: hashlib.md5(a.encode()).hexdigest()[:8]
+    for a in set(ALL_INTERVENTIONS) | set(ACTIONS_BY_DRIVER.values())
+}
+
+
+def _action_hash(action: str) -> str:
+    h = _ACTION_HASH.get(action)
+    if h is None:
+        # Novel AI-generated wording: fall back to hashing on the spot
+        h = hashlib.md5(action.encode()).hexdigest()[:8]
+    return h
+
+
 def get_actions_for_drivers(drivers: list[str]) -> list[str]:
     """Return 1-2 unique action strings for the given drivers."""
     seen = set()
@@ -105,10 +162,8 @@ def get_today_interventions(
     # Create intervention IDs from actions (use hash or index for uniqueness)
     intervention_ids = []
     for i, action in enumerate(actions[:3]):  # Max 3 interventions
-        # Create a stable ID from the action text (first 50 chars + hash)
-        import hashlib
-        action_hash = hashlib.md5(action.encode()).hexdigest()[:8]
-        iid = f"ai_{action_hash}_{i}"
+        # Create a stable ID from the action text hash
+        iid = f"ai_{_action_hash(action)}_{i}"
         intervention_ids.append((iid, action))
     
     if not intervention_ids:
@@ -121,17 +176,16 @@ def get_today_interventions(
     )
     by_key = {e.intervention_id: e for e in existing}
     result = []
-    
+    to_add = []
+    dirty = False
+
     for iid, title in intervention_ids:
-        if iid in by_key:
+        ent = by_key.get(iid)
+        if ent is not None:
             # Update title in case AI selected different interventions
-            by_key[iid].title = title
-            db.commit()
-            result.append({
-                "intervention_id": iid,
-                "title": by_key[iid].title,
-                "completed": by_key[iid].completed,
-            })
+            if ent.title != title:
+                ent.title = title
+                dirty = True
         else:
             ent = Intervention(
                 user_id=user_id,
@@ -140,14 +194,18 @@ def get_today_interventions(
                 title=title,
                 completed=False,
             )
-            db.add(ent)
-            db.commit()
-            db.refresh(ent)
-            result.append({
-                "intervention_id": ent.intervention_id,
-                "title": ent.title,
-                "completed": ent.completed,
-            })
+            to_add.append(ent)
+        result.append({
+            "intervention_id": ent.intervention_id,
+            "title": ent.title,
+            "completed": ent.completed,
+        })
+    # One commit for the whole batch (and none when nothing changed),
+    # instead of an fsync per intervention.
+    if to_add:
+        db.add_all(to_add)
+    if to_add or dirty:
+        db.commit()
     return result
 
 
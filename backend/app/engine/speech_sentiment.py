@@ -11,9 +11,46 @@ try:
 except ImportError:
     pass
 
+# Constructing the analyzer re-parses the ~7k-entry lexicon from disk, so
+# build it once; polarity_scores itself is thread-safe.
+_ANALYZER = SentimentIntensityAnalyzer() if _VADER_AVAILABLE else None
+
+
+# Local Whisper (faster-whisper / CTranslate2), opt-in via WHISPER_LOCAL=1.
+# The model is loaded once per process; int8 keeps CPU inference cheap.
+_WHISPER_MODEL = None
+
+
+def _get_local_whisper():
+    global _WHISPER_MODEL
+    if _WHISPER_MODEL is None:
+        from faster_whisper import WhisperModel
+        _WHISPER_MODEL = WhisperModel(
+            os.environ.get("WHISPER_LOCAL_MODEL", "base.en"),
+            device="auto",
+            compute_type="int8",
+        )
+    return _WHISPER_MODEL
+
+
+def _transcribe_local(audio_path: str) -> Optional[str]:
+    """Transcribe on-box with faster-whisper. Returns None if unavailable or failed."""
+    try:
+        segments, _ = _get_local_whisper().transcribe(audio_path)
+        text = " ".join(s.text for s in segments).strip()
+        return text or None
+    except Exception:
+        return None
+
 
 def transcribe_audio(audio_path: str) -> Optional[str]:
-    """Transcribe audio file to text using OpenAI Whisper API. Returns None if disabled or failed."""
+    """Transcribe audio file to text. Local faster-whisper when WHISPER_LOCAL=1
+    (no per-clip API cost or network round trip), else OpenAI Whisper API.
+    Returns None if disabled or failed."""
+    if os.environ.get("WHISPER_LOCAL") == "1":
+        text = _transcribe_local(audio_path)
+        if text:
+            return text
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key or not api_key.strip():
         return None
@@ -36,11 +73,10 @@ def sentiment_from_text(text: str) -> Optional[dict[str, Any]]:
     """Run VADER sentiment on text. Returns dict with compound, pos, neg, neu, label. No transcript stored."""
     if not text or not text.strip():
         return None
-    if not _VADER_AVAILABLE:
+    if _ANALYZER is None:
         return None
     try:
-        analyzer = SentimentIntensityAnalyzer()
-        scores = analyzer.polarity_scores(text.strip())
+        scores = _ANALYZER.polarity_scores(text.strip())
         compound = float(scores.get("compound", 0))
         if compound >= 0.05:
             label = "positive"
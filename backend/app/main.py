@@ -1,5 +1,6 @@
 """Sentra FastAPI app: CORS, routes, startup seed."""
 import os
+import re
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -10,45 +11,51 @@ from fastapi import FastAPI
 load_dotenv()
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.db import init_db
+from app.db import init_db, optimize_db
 from app.seed import run_seed
 from app.routes import events, checkin, score, insight, voice, interventions, org, signals
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Sync handlers and the sync DB session all share anyio's default
+    # 40-token threadpool, which caps request concurrency for DB work.
+    from anyio import to_thread
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("SENTRA_THREADPOOL_TOKENS", "100"))
     init_db()
     run_seed()
     yield
+    from app.services.chatgpt import close_client
+    await close_client()
+    optimize_db()
 
 
 app = FastAPI(title="Sentra API", lifespan=lifespan)
 
-# CORS configuration - allow Netlify and localhost
-allowed_origins = [
-    "http://localhost:5173",
-    "http://localhost:5174",
-    "http://localhost:5175",
-    "http://127.0.0.1:5173",
-    "http://127.0.0.1:5174",
-    "http://127.0.0.1:5175",
+# CORS configuration - allow Netlify and localhost. One anchored regex union
+# instead of a growing allow_origins list: Starlette matches it once per
+# preflight, and the netlify.app branch covers preview deploys without a
+# redeploy per branch.
+_origin_patterns = [
+    r"https?://(localhost|127\.0\.0\.1):517[345]",
+    r"https://[a-z0-9-]+(--[a-z0-9-]+)?\.netlify\.app",
 ]
 
-# Add Netlify domain from environment variable if set
+# Add Netlify domain from environment variable if set (http and https)
 if netlify_url := os.getenv("NETLIFY_URL"):
-    allowed_origins.append(netlify_url)
-    # Also add http version if https
-    if netlify_url.startswith("https://"):
-        allowed_origins.append(netlify_url.replace("https://", "http://"))
+    _origin_patterns.append(r"https?://" + re.escape(netlify_url.split("://", 1)[-1]))
 
 # For production: Set ALLOWED_ORIGINS env var with comma-separated domains
 # Example: ALLOWED_ORIGINS=https://your-app.netlify.app,https://preview--your-app.netlify.app
 if allowed_env := os.getenv("ALLOWED_ORIGINS"):
-    allowed_origins.extend([origin.strip() for origin in allowed_env.split(",")])
+    _origin_patterns.extend(re.escape(origin.strip()) for origin in allowed_env.split(",") if origin.strip())
+
+allow_origin_regex = "^(" + "|".join(_origin_patterns) + ")$"
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origin_regex=allow_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -2,7 +2,7 @@
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Column, Float, Integer, String, Text, Boolean, ForeignKey, Date, DateTime, JSON
+from sqlalchemy import Column, Float, Integer, String, Text, Boolean, ForeignKey, Date, DateTime, Index, JSON, UniqueConstraint, text
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -12,13 +12,17 @@ class User(Base):
     __tablename__ = "users"
     id = Column(String(64), primary_key=True)
     is_org_user = Column(Boolean, default=False)  # for Care Mode aggregate users
+    # Partial index: the org roster query scans only the (small) org slice
+    __table_args__ = (
+        Index("ix_users_org", "id", sqlite_where=text("is_org_user = 1")),
+    )
 
 
 class DailySummary(Base):
     __tablename__ = "daily_summaries"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(64), ForeignKey("users.id"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    user_id = Column(String(64), ForeignKey("users.id"), nullable=False)
+    date = Column(Date, nullable=False)
     # Check-in fields
     sleep_hours = Column(Float, nullable=True)
     sleep_quality = Column(Float, nullable=True)  # 1-5
@@ -30,6 +34,9 @@ class DailySummary(Base):
     typing_backspace_ratio = Column(Float, nullable=True)
     typing_fragmentation = Column(Float, nullable=True)  # pauses > 2s count
     typing_late_night = Column(Boolean, nullable=True)
+    # Sessions folded into the averages above; lets new sessions update the
+    # aggregates incrementally instead of re-scanning the day
+    typing_session_count = Column(Integer, nullable=True)
     # Voice strain (openSMILE eGeMAPS baseline drift)
     voice_strain_score = Column(Integer, nullable=True)  # 0-100
     voice_strain_level = Column(String(32), nullable=True)  # low, medium, high
@@ -37,7 +44,13 @@ class DailySummary(Base):
     # Optional: sentiment from speech (no transcript stored)
     speech_sentiment_compound = Column(Float, nullable=True)  # -1 to 1
     speech_sentiment_label = Column(String(32), nullable=True)  # positive, neutral, negative
-    __table_args__ = ({"sqlite_autoincrement": True},)
+    # Every hot query filters user_id + a date range; the unique composite
+    # index serves those as a single range scan and makes one-row-per-day
+    # a hard guarantee (upserts key on it).
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", name="uq_daily_user_date"),
+        {"sqlite_autoincrement": True},
+    )
 
 
 class VoiceSession(Base):
@@ -61,8 +74,8 @@ class TypingSession(Base):
     """Raw typing session submissions; used to compute daily aggregates."""
     __tablename__ = "typing_sessions"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(64), ForeignKey("users.id"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    user_id = Column(String(64), ForeignKey("users.id"), nullable=False)
+    date = Column(Date, nullable=False)
     avg_interval_ms = Column(Float, nullable=False)
     std_interval_ms = Column(Float, nullable=False)
     backspace_ratio = Column(Float, nullable=False)
@@ -70,19 +83,29 @@ class TypingSession(Base):
     fragmentation_count = Column(Integer, nullable=False)  # pauses > 2s
     late_night = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Day re-scans filter user_id + date; one composite range scan
+    __table_args__ = (Index("ix_typing_sessions_user_date", "user_id", "date"),)
 
 
 class RiskScore(Base):
     __tablename__ = "risk_scores"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(64), ForeignKey("users.id"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    user_id = Column(String(64), ForeignKey("users.id"), nullable=False)
+    date = Column(Date, nullable=False)
     wellbeing_score = Column(Float, nullable=False)  # 0-100 (inverted: higher = better)
     status = Column(String(32), nullable=False)  # Stable, Watch, High
     momentum = Column(String(32), nullable=False)  # stable, slow_rise, rapid_rise
     confidence = Column(String(32), nullable=False)  # low, med, high
     drivers = Column(JSON, nullable=True)  # list of driver keys
-    __table_args__ = ({"sqlite_autoincrement": True},)
+    # Stamped at write time so read paths don't re-run the regression
+    momentum_label = Column(String(32), nullable=True)  # Rising, Stable, Recovering
+    momentum_strength = Column(String(32), nullable=True)  # slow, rapid
+    # Digest of the scoring inputs; lets recompute skip unchanged days
+    input_hash = Column(String(16), nullable=True)
+    __table_args__ = (
+        Index("ix_risk_scores_user_date", "user_id", "date"),
+        {"sqlite_autoincrement": True},
+    )
 
 
 class Intervention(Base):
@@ -1,16 +1,20 @@
 """POST /api/events/typing and POST /api/events/voice."""
 import tempfile
+import threading
 import os
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.auth_firebase import get_firebase_uid
-from app.db import get_db
-from app.models import TypingSession, DailySummary, User, VoiceSession
+from app.db import ensure_user, get_db
+from app.models import TypingSession, DailySummary, VoiceSession
 from app.schemas import TypingEventCreate
-from app.engine.drift import compute_risk_for_date
+from app.engine.drift import schedule_risk_recompute
 from app.engine.voice_features import (
     VOICE_KEYS,
     extract_egemaps,
@@ -26,19 +30,9 @@ from app.engine.speech_sentiment import get_speech_sentiment_only
 router = APIRouter(prefix="/api/events", tags=["events"])
 
 
-def _get_or_create_user(db: Session, user_id: str) -> User:
-    u = db.query(User).filter(User.id == user_id).first()
-    if not u:
-        u = User(id=user_id, is_org_user=False)
-        db.add(u)
-        db.commit()
-        db.refresh(u)
-    return u
-
-
 @router.post("/typing")
-def submit_typing_event(payload: TypingEventCreate, uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
-    _get_or_create_user(db, uid)
+def submit_typing_event(payload: TypingEventCreate, background: BackgroundTasks, uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
+    ensure_user(db, uid)
     today = date.today()
     session = TypingSession(
         user_id=uid,
@@ -51,65 +45,95 @@ def submit_typing_event(payload: TypingEventCreate, uid: str = Depends(get_fireb
         late_night=payload.late_night,
     )
     db.add(session)
-    db.commit()
-    # Update daily summary typing aggregates (average of all sessions today)
-    summaries = (
-        db.query(TypingSession)
-        .filter(TypingSession.user_id == uid, TypingSession.date == today)
-        .all()
+    # Update daily summary typing aggregates incrementally: fold the new
+    # session into the stored running averages instead of re-reading every
+    # TypingSession of the day on each submission. Seed the day row with an
+    # atomic INSERT OR IGNORE first so two first-of-day sessions can't race
+    # the unique (user_id, date) constraint into an IntegrityError; the
+    # read-modify-write below then always finds a row.
+    db.execute(
+        sqlite_insert(DailySummary)
+        .values(user_id=uid, date=today)
+        .on_conflict_do_nothing(index_elements=["user_id", "date"])
     )
-    n = len(summaries)
-    avg_i = sum(s.avg_interval_ms for s in summaries) / n
-    std_i = sum(s.std_interval_ms for s in summaries) / n
-    bs = sum(s.backspace_ratio for s in summaries) / n
-    frag = sum(s.fragmentation_count for s in summaries)
-    late = any(s.late_night for s in summaries)
-    daily = db.query(DailySummary).filter(
-        DailySummary.user_id == uid,
-        DailySummary.date == today,
-    ).first()
-    if not daily:
-        daily = DailySummary(
-            user_id=uid,
-            date=today,
-            typing_avg_interval_ms=avg_i,
-            typing_std_ms=std_i,
-            typing_backspace_ratio=bs,
-            typing_fragmentation=float(frag),
-            typing_late_night=late,
-        )
-        db.add(daily)
-    else:
+    daily = db.execute(
+        select(DailySummary).where(DailySummary.user_id == uid, DailySummary.date == today)
+    ).scalar_one()
+    if not daily.typing_session_count or daily.typing_avg_interval_ms is None:
+        # Row just seeded above, predating the counter, or created by
+        # check-in/voice only: one aggregate SELECT seeds the counters in
+        # the SQL engine (no row hydration), then it's incremental.
+        # Flush so the scan sees the session added above (autoflush is off).
+        db.flush()
+        n, avg_i, std_i, bs, frag, late = db.execute(
+            select(
+                func.count(TypingSession.id),
+                func.avg(TypingSession.avg_interval_ms),
+                func.avg(TypingSession.std_interval_ms),
+                func.avg(TypingSession.backspace_ratio),
+                func.sum(TypingSession.fragmentation_count),
+                func.max(TypingSession.late_night),  # SQLite's bool_or
+            ).where(TypingSession.user_id == uid, TypingSession.date == today)
+        ).one()
         daily.typing_avg_interval_ms = avg_i
         daily.typing_std_ms = std_i
         daily.typing_backspace_ratio = bs
         daily.typing_fragmentation = float(frag)
-        daily.typing_late_night = late
+        daily.typing_late_night = bool(late)
+        daily.typing_session_count = n
+    else:
+        n = daily.typing_session_count
+        daily.typing_avg_interval_ms += (payload.avg_interval_ms - daily.typing_avg_interval_ms) / (n + 1)
+        daily.typing_std_ms += (payload.std_interval_ms - daily.typing_std_ms) / (n + 1)
+        daily.typing_backspace_ratio += (payload.backspace_ratio - daily.typing_backspace_ratio) / (n + 1)
+        daily.typing_fragmentation = (daily.typing_fragmentation or 0.0) + float(payload.fragmentation_count)
+        daily.typing_late_night = bool(daily.typing_late_night) or payload.late_night
+        daily.typing_session_count = n + 1
     db.commit()
-    compute_risk_for_date(db, uid, today)
+    # Risk recompute happens after the response; typing bursts coalesce
+    schedule_risk_recompute(background, uid, today)
     return {"ok": True, "message": "Typing session recorded. No raw content is stored."}
 
 
-@router.post("/voice")
-async def submit_voice_event(
-    file: UploadFile = File(..., description="Audio file (wav, mp3, etc.)"),
-    analyze_speech: bool = Query(False, description="If true, transcribe and analyze sentiment of speech (no transcript stored)."),
-    uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
-):
-    """Accept audio upload, extract eGeMAPS, compute baseline drift, store voice strain. Optionally analyze speech sentiment."""
-    _get_or_create_user(db, uid)
-    today = date.today()
+# Voice baseline stats per user, keyed by the newest session id that fed
+# them: each upload adds a session, so a changed max(id) invalidates the
+# entry by itself and the per-upload recompute only runs when the
+# baseline actually moved.
+_VOICE_BASELINE_CACHE: dict[str, tuple[int, dict, dict, int]] = {}
+_VOICE_BASELINE_LOCK = threading.Lock()
 
-    if not file.content_type or not file.content_type.startswith("audio/"):
-        raise HTTPException(status_code=400, detail="Expected an audio file.")
 
-    suffix = os.path.splitext(file.filename or "")[1] or ".wav"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+def _voice_baseline_for(db: Session, uid: str) -> tuple[dict, dict, int]:
+    """(mean, std, session count) over the user's last BASELINE_N sessions."""
+    last_id = db.execute(
+        select(func.max(VoiceSession.id)).where(
+            VoiceSession.user_id == uid, VoiceSession.voice_features.isnot(None)
+        )
+    ).scalar()
+    if last_id is None:
+        return {}, {}, 0
+    with _VOICE_BASELINE_LOCK:
+        cached = _VOICE_BASELINE_CACHE.get(uid)
+    if cached is not None and cached[0] == last_id:
+        return cached[1], cached[2], cached[3]
 
+    baseline_sessions = db.execute(
+        select(VoiceSession.voice_features)
+        .where(VoiceSession.user_id == uid, VoiceSession.voice_features.isnot(None))
+        .order_by(VoiceSession.date.desc(), VoiceSession.id.desc())
+        .limit(BASELINE_N)
+    ).all()
+    sessions_for_baseline = [{"voice_features": feats} for (feats,) in baseline_sessions]
+    mean, std = baseline_from_sessions(sessions_for_baseline, VOICE_KEYS)
+    n = len(sessions_for_baseline)
+    with _VOICE_BASELINE_LOCK:
+        _VOICE_BASELINE_CACHE[uid] = (last_id, mean, std, n)
+    return mean, std, n
+
+
+def _analyze_audio(tmp_path: str, analyze_speech: bool) -> tuple:
+    """Duration, eGeMAPS features, and optional sentiment for an uploaded clip.
+    Sync and expensive; run from the threadpool. Removes the temp file."""
     speech_sentiment = None
     try:
         duration_s = get_audio_duration_sec(tmp_path)
@@ -121,43 +145,29 @@ async def submit_voice_event(
             os.unlink(tmp_path)
         except OSError:
             pass
+    return duration_s, features, speech_sentiment
 
-    if not features:
-        raise HTTPException(
-            status_code=422,
-            detail="Could not extract voice features. Install opensmile/soundfile and ensure the file is valid audio.",
-        )
-
-    used_keys = [k for k in VOICE_KEYS if k in features]
-    if len(used_keys) < 4:
-        raise HTTPException(
-            status_code=422,
-            detail="Not enough eGeMAPS features extracted. Need at least 4.",
-        )
-
-    # Baseline: last N voice sessions (any date – multiple recordings same day count)
-    baseline_sessions = (
-        db.query(VoiceSession)
-        .filter(
-            VoiceSession.user_id == uid,
-            VoiceSession.voice_features.isnot(None),
-        )
-        .order_by(VoiceSession.date.desc(), VoiceSession.id.desc())
-        .limit(BASELINE_N)
-        .all()
-    )
-    sessions_for_baseline = [
-        {"voice_features": s.voice_features}
-        for s in baseline_sessions
-    ]
-
-    baseline_mean, baseline_std = baseline_from_sessions(sessions_for_baseline, VOICE_KEYS)
 
-    # Total sessions after we save this one (for "Building baseline (k/7)" message)
-    total_sessions_after = db.query(VoiceSession).filter(VoiceSession.user_id == uid).count() + 1
+def _store_voice_results(
+    db: Session,
+    uid: str,
+    duration_s: float,
+    features: dict,
+    used_keys: list[str],
+    speech_sentiment: dict | None,
+) -> dict:
+    """Drift vs baseline, persistence, and risk recompute (sync, threadpool)."""
+    today = date.today()
+    # Baseline: last N voice sessions (any date – multiple recordings same day
+    # count), served from the per-user cache when no session was added since.
+    baseline_mean, baseline_std, baseline_n = _voice_baseline_for(db, uid)
 
     if not baseline_mean or not baseline_std:
-        # Building baseline: need at least 2 sessions to compute mean/std
+        # Building baseline: need at least 2 sessions to compute mean/std.
+        # Only this branch needs the session count (for the "k/7" message).
+        total_sessions_after = db.execute(
+            select(func.count(VoiceSession.id)).where(VoiceSession.user_id == uid)
+        ).scalar() + 1
         conf = "low"
         score_val = 0
         level = "low"
@@ -167,7 +177,7 @@ async def submit_voice_event(
         result = compute_voice_drift(features, baseline_mean, baseline_std, VOICE_KEYS)
         drift = result["drift_score"]
         score_val, level = drift_to_level(drift)
-        conf = confidence_level(len(baseline_sessions) + 1, duration_s, len(used_keys))
+        conf = confidence_level(baseline_n + 1, duration_s, len(used_keys))
         drivers = result.get("drivers", [])
         message = "Your voice patterns are drifting from baseline." if level != "low" else None
 
@@ -186,33 +196,19 @@ async def submit_voice_event(
         speech_sentiment_label=sent_label,
     )
     db.add(session)
-    db.commit()
 
-    # Update or create daily summary voice fields (latest voice of the day)
-    daily = (
-        db.query(DailySummary)
-        .filter(DailySummary.user_id == uid, DailySummary.date == today)
-        .first()
-    )
-    if daily:
-        daily.voice_strain_score = score_val
-        daily.voice_strain_level = level
-        daily.voice_confidence = conf
-        daily.speech_sentiment_compound = sent_compound
-        daily.speech_sentiment_label = sent_label
-    else:
-        daily = DailySummary(
-            user_id=uid,
-            date=today,
-            voice_strain_score=score_val,
-            voice_strain_level=level,
-            voice_confidence=conf,
-            speech_sentiment_compound=sent_compound,
-            speech_sentiment_label=sent_label,
-        )
-        db.add(daily)
+    # Update or create daily summary voice fields (latest voice of the day):
+    # atomic upsert keyed on (user_id, date), touching only the voice columns.
+    voice_fields = {
+        "voice_strain_score": score_val,
+        "voice_strain_level": level,
+        "voice_confidence": conf,
+        "speech_sentiment_compound": sent_compound,
+        "speech_sentiment_label": sent_label,
+    }
+    stmt = sqlite_insert(DailySummary).values(user_id=uid, date=today, **voice_fields)
+    db.execute(stmt.on_conflict_do_update(index_elements=["user_id", "date"], set_=voice_fields))
     db.commit()
-    compute_risk_for_date(db, uid, today)
 
     payload = {
         "ok": True,
@@ -225,3 +221,53 @@ async def submit_voice_event(
     if speech_sentiment is not None:
         payload["speech_sentiment"] = speech_sentiment
     return payload
+
+
+@router.post("/voice")
+async def submit_voice_event(
+    background: BackgroundTasks,
+    file: UploadFile = File(..., description="Audio file (wav, mp3, etc.)"),
+    analyze_speech: bool = Query(False, description="If true, transcribe and analyze sentiment of speech (no transcript stored)."),
+    uid: str = Depends(get_firebase_uid),
+    db: Session = Depends(get_db),
+):
+    """Accept audio upload, extract eGeMAPS, compute baseline drift, store voice strain. Optionally analyze speech sentiment."""
+    await run_in_threadpool(ensure_user, db, uid)
+
+    if not file.content_type or not file.content_type.startswith("audio/"):
+        raise HTTPException(status_code=400, detail="Expected an audio file.")
+
+    suffix = os.path.splitext(file.filename or "")[1] or ".wav"
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        # Stream to disk in 64 KiB chunks: peak memory stays O(chunk) instead
+        # of holding the whole multi-MB clip in a bytes object.
+        while chunk := await file.read(1 << 16):
+            tmp.write(chunk)
+        tmp_path = tmp.name
+
+    # Feature extraction (native openSMILE) and optional transcription are the
+    # expensive sync parts: run them in the threadpool so the event loop isn't
+    # pinned for the duration of the analysis.
+    duration_s, features, speech_sentiment = await run_in_threadpool(
+        _analyze_audio, tmp_path, analyze_speech
+    )
+
+    if not features:
+        raise HTTPException(
+            status_code=422,
+            detail="Could not extract voice features. Install opensmile/soundfile and ensure the file is valid audio.",
+        )
+
+    used_keys = [k for k in VOICE_KEYS if k in features]
+    if len(used_keys) < 4:
+        raise HTTPException(
+            status_code=422,
+            detail="Not enough eGeMAPS features extracted. Need at least 4.",
+        )
+
+    result = await run_in_threadpool(
+        _store_voice_results, db, uid, duration_s, features, used_keys, speech_sentiment
+    )
+    # Risk recompute happens after the response; bursts coalesce per user/day
+    schedule_risk_recompute(background, uid, date.today())
+    return result
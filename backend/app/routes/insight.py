@@ -2,30 +2,31 @@
 from datetime import date
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.auth_firebase import get_firebase_uid
 from app.db import get_db
 from app.engine.drift import get_today_score
+from app.engine.insight import suggest_actions
 from app.models import DailySummary
 from app.services.chatgpt import generate_insight as generate_ai_insight
 
 router = APIRouter(prefix="/api", tags=["insight"])
 
 
-@router.get("/insight/today")
-async def insight_today(uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
+def _score_and_context(db: Session, uid: str) -> tuple[list, str, dict]:
+    """Sync half of insight_today: scoring plus today's check-in context."""
     score = get_today_score(db, uid)
     drivers = (score.get("drivers") or []) if score else []
     status = (score.get("status") or "Stable") if score else "Stable"
-    
-    # Get today's user data for context
+
     today = date.today()
     summary = (
         db.query(DailySummary)
         .filter(DailySummary.user_id == uid, DailySummary.date == today)
         .first()
     )
-    
+
     user_context = {}
     if summary:
         user_context = {
@@ -38,13 +39,20 @@ async def insight_today(uid: str = Depends(get_firebase_uid), db: Session = Depe
             "typing_backspace_ratio": summary.typing_backspace_ratio,
             "typing_fragmentation": summary.typing_fragmentation,
         }
-    
+    return drivers, status, user_context
+
+
+@router.get("/insight/today")
+async def insight_today(uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
+    # Scoring and DB reads run in the threadpool; only the AI call is awaited
+    # directly, so the event loop stays free for other requests.
+    drivers, status, user_context = await run_in_threadpool(_score_and_context, db, uid)
+
     # Use AI-powered insight generation
     result = await generate_ai_insight(drivers, status, user_context)
     
     # Ensure suggested_actions is included (from the fallback function)
     if "suggested_actions" not in result:
-        from app.engine.insight import suggest_actions
         result["suggested_actions"] = suggest_actions(drivers)[:2]
     
     return result
@@ -4,11 +4,12 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.auth_firebase import get_firebase_uid
 from app.db import get_db
 from app.engine.drift import get_today_score
-from app.engine.interventions import get_today_interventions, complete_intervention, ALL_INTERVENTIONS
+from app.engine.interventions import get_today_interventions, complete_intervention, shortlist_for_drivers
 from app.models import DailySummary
 from app.schemas import InterventionComplete
 from app.services.chatgpt import select_interventions
@@ -16,20 +17,19 @@ from app.services.chatgpt import select_interventions
 router = APIRouter(prefix="/api", tags=["interventions"])
 
 
-@router.get("/interventions/today")
-async def interventions_today(uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
+def _score_and_context(db: Session, uid: str) -> tuple[list, str, dict]:
+    """Sync half of interventions_today: scoring plus today's check-in context."""
     score = get_today_score(db, uid)
     drivers = (score.get("drivers") or []) if score else []
     status = (score.get("status") or "Stable") if score else "Stable"
-    
-    # Get today's user data for context
+
     today = date.today()
     summary = (
         db.query(DailySummary)
         .filter(DailySummary.user_id == uid, DailySummary.date == today)
         .first()
     )
-    
+
     user_context = {}
     if summary:
         user_context = {
@@ -42,12 +42,23 @@ async def interventions_today(uid: str = Depends(get_firebase_uid), db: Session
             "typing_backspace_ratio": summary.typing_backspace_ratio,
             "typing_fragmentation": summary.typing_fragmentation,
         }
-    
-    # Use AI to select interventions
-    selected_interventions = await select_interventions(drivers, status, user_context, ALL_INTERVENTIONS)
-    
+    return drivers, status, user_context
+
+
+@router.get("/interventions/today")
+async def interventions_today(uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
+    # The handler is async for the AI call; keep the sync DB/scoring work in
+    # the threadpool so it doesn't stall the event loop for other requests.
+    drivers, status, user_context = await run_in_threadpool(_score_and_context, db, uid)
+
+    # Use AI to select interventions from a driver-themed shortlist (keeps
+    # the prompt small; the full pool never needs to ride along)
+    selected_interventions = await select_interventions(
+        drivers, status, user_context, shortlist_for_drivers(drivers)
+    )
+
     # Convert to intervention format and store/retrieve from DB
-    return get_today_interventions(db, uid, drivers, selected_interventions)
+    return await run_in_threadpool(get_today_interventions, db, uid, drivers, selected_interventions)
 
 
 @router.post("/intervention/complete")
@@ -1,22 +1,52 @@
 """GET /api/org/summary - Care Mode aggregate (counts, no PII)."""
-from collections import Counter
+import time
+from collections import Counter, defaultdict
 from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.db import get_db
-from app.engine.drift import _compute_momentum_label_and_strength, TREND_DAYS
+from app.engine.drift import _compute_momentum_label_and_strength, TREND_DAYS, risk_write_version
+from app.engine.insight import DRIVER_LABELS
 from app.models import RiskScore, User
 
 router = APIRouter(prefix="/api/org", tags=["org"])
 
+# Dashboards poll the summary far more often than scores change; cache the
+# whole response for a short window, keyed on the risk-write version so any
+# score write refreshes it immediately. Single slot, benign races.
+_SUMMARY_CACHE: dict = {}
+_SUMMARY_TTL_SEC = 30
+
+# Org roster changes only when an org user row is seeded; a longer TTL keeps
+# the users query off the summary-cache misses that follow every score write.
+_ORG_IDS_CACHE: dict = {}
+_ORG_IDS_TTL_SEC = 300
+
+
+def _org_user_ids(db: Session) -> list[str]:
+    now = time.monotonic()
+    cached = _ORG_IDS_CACHE.get("ids")
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    ids = db.execute(select(User.id).where(User.is_org_user == True)).scalars().all()
+    _ORG_IDS_CACHE["ids"] = (now + _ORG_IDS_TTL_SEC, ids)
+    return ids
+
 
 @router.get("/summary")
 def org_summary(db: Session = Depends(get_db)):
     today = date.today()
+    version = risk_write_version()
+    cached = _SUMMARY_CACHE.get("summary")
+    if cached is not None:
+        c_today, c_version, expires, value = cached
+        if c_today == today and c_version == version and expires > time.monotonic():
+            return value
     # Latest score per org user (today or most recent)
-    org_ids = [r.id for r in db.query(User.id).filter(User.is_org_user == True).all()]
+    org_ids = _org_user_ids(db)
     if not org_ids:
         return {
             "counts": {"Stable": 0, "Watch": 0, "High": 0},
@@ -27,43 +57,58 @@ def org_summary(db: Session = Depends(get_db)):
             "top_org_driver": None,
             "total_users": 0,
         }
-    status_counts = Counter()
-    momentum_counts = Counter()
-    momentum_label_counts = Counter()
-    all_drivers = []
+    # Fixed key spaces: plain pre-keyed dicts skip Counter's missing-key
+    # machinery per increment, and the response shape matches the zero-filled
+    # empty-org payload above. Drivers stay a Counter (open key set).
+    status_counts = {"Stable": 0, "Watch": 0, "High": 0}
+    momentum_counts = {"stable": 0, "slow_rise": 0, "rapid_rise": 0}
+    momentum_label_counts = {"Rising": 0, "Stable": 0, "Recovering": 0}
+    driver_counter = Counter()
     scores = []
-    
-    for uid in org_ids:
-        r = (
-            db.query(RiskScore)
-            .filter(RiskScore.user_id == uid, RiskScore.date <= today)
-            .order_by(RiskScore.date.desc())
-            .first()
+
+    # Latest score per user in one round trip: group-by-max subquery joined
+    # back to the row, instead of a query (plus a momentum window query)
+    # per org user.
+    latest = (
+        select(RiskScore.user_id, func.max(RiskScore.date).label("d"))
+        .where(RiskScore.user_id.in_(org_ids), RiskScore.date <= today)
+        .group_by(RiskScore.user_id)
+        .subquery()
+    )
+    latest_rows = db.execute(
+        select(RiskScore.user_id, RiskScore.status, RiskScore.momentum,
+               RiskScore.wellbeing_score, RiskScore.drivers)
+        .join(latest, (RiskScore.user_id == latest.c.user_id) & (RiskScore.date == latest.c.d))
+    ).all()
+
+    # One momentum window fetch for everyone, grouped in Python
+    window_rows = db.execute(
+        select(RiskScore.user_id, RiskScore.wellbeing_score)
+        .where(
+            RiskScore.user_id.in_(org_ids),
+            RiskScore.date >= today - timedelta(days=TREND_DAYS),
+            RiskScore.date <= today,
         )
-        if r:
-            status_counts[r.status] += 1
-            momentum_counts[r.momentum] += 1
-            scores.append(r.wellbeing_score)
-            
-            # Compute momentum_label for this user
-            user_scores = (
-                db.query(RiskScore)
-                .filter(
-                    RiskScore.user_id == uid,
-                    RiskScore.date >= today - timedelta(days=TREND_DAYS),
-                    RiskScore.date <= today,
-                )
-                .order_by(RiskScore.date)
-                .all()
-            )
-            if len(user_scores) >= 2:
-                recent_scores = [s.wellbeing_score for s in user_scores]
-                momentum_label, _ = _compute_momentum_label_and_strength(recent_scores)
-                momentum_label_counts[momentum_label] += 1
-            
-            # Collect drivers
-            if r.drivers:
-                all_drivers.extend(r.drivers[:3])
+        .order_by(RiskScore.user_id, RiskScore.date)
+    ).all()
+    window_by_user = defaultdict(list)
+    for uid, wellbeing in window_rows:
+        window_by_user[uid].append(wellbeing)
+
+    for uid, status, momentum, wellbeing, drivers in latest_rows:
+        status_counts[status] += 1
+        momentum_counts[momentum] += 1
+        scores.append(wellbeing)
+
+        # Compute momentum_label for this user
+        recent_scores = window_by_user.get(uid, [])
+        if len(recent_scores) >= 2:
+            momentum_label, _ = _compute_momentum_label_and_strength(recent_scores)
+            momentum_label_counts[momentum_label] += 1
+
+        # Tally drivers in place (no intermediate list)
+        if drivers:
+            driver_counter.update(drivers[:3])
     
     total = len(org_ids)
     avg_risk = (100 - sum(scores) / len(scores)) if scores else 0
@@ -81,14 +126,11 @@ def org_summary(db: Session = Depends(get_db)):
     
     # Find top org driver
     top_org_driver = None
-    if all_drivers:
-        driver_counter = Counter(all_drivers)
-        top_driver_key = driver_counter.most_common(1)[0][0] if driver_counter else None
-        if top_driver_key:
-            from app.engine.insight import DRIVER_LABELS
-            top_org_driver = DRIVER_LABELS.get(top_driver_key, top_driver_key)
+    if driver_counter:
+        top_driver_key = driver_counter.most_common(1)[0][0]
+        top_org_driver = DRIVER_LABELS.get(top_driver_key, top_driver_key)
     
-    return {
+    result = {
         "counts": dict(status_counts),
         "average_risk": round(avg_risk, 1),
         "momentum_distribution": dict(momentum_counts),
@@ -97,3 +139,5 @@ def org_summary(db: Session = Depends(get_db)):
         "top_org_driver": top_org_driver,
         "total_users": total,
     }
+    _SUMMARY_CACHE["summary"] = (today, version, time.monotonic() + _SUMMARY_TTL_SEC, result)
+    return result
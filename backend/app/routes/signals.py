@@ -1,7 +1,9 @@
 """GET /api/signals/descriptions - AI-powered signal descriptions."""
+import asyncio
 from datetime import date
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.auth_firebase import get_firebase_uid
 from app.db import get_db
@@ -11,16 +13,15 @@ from app.services.chatgpt import generate_signal_description
 router = APIRouter(prefix="/api", tags=["signals"])
 
 
-@router.get("/signals/descriptions")
-async def get_signal_descriptions(uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
-    """Get AI-powered descriptions for Sleep, Activity, and Typing signals."""
+def _today_user_data(db: Session, uid: str) -> dict:
+    """Fetch today's check-in fields for the AI prompts (sync, threadpool)."""
     today = date.today()
     summary = (
         db.query(DailySummary)
         .filter(DailySummary.user_id == uid, DailySummary.date == today)
         .first()
     )
-    
+
     user_data = {}
     if summary:
         user_data = {
@@ -33,11 +34,22 @@ async def get_signal_descriptions(uid: str = Depends(get_firebase_uid), db: Sess
             "typing_backspace_ratio": summary.typing_backspace_ratio,
             "typing_fragmentation": summary.typing_fragmentation,
         }
-    
-    # Generate AI descriptions for each signal
-    sleep_desc = await generate_signal_description("sleep", user_data)
-    activity_desc = await generate_signal_description("activity", user_data)
-    typing_desc = await generate_signal_description("typing", user_data)
+    return user_data
+
+
+@router.get("/signals/descriptions")
+async def get_signal_descriptions(uid: str = Depends(get_firebase_uid), db: Session = Depends(get_db)):
+    """Get AI-powered descriptions for Sleep, Activity, and Typing signals."""
+    # DB read goes through the threadpool so the loop only waits on the AI calls.
+    user_data = await run_in_threadpool(_today_user_data, db, uid)
+
+    # Generate the three AI descriptions concurrently: each is an LLM round
+    # trip, so total latency is one call instead of three back to back.
+    sleep_desc, activity_desc, typing_desc = await asyncio.gather(
+        generate_signal_description("sleep", user_data),
+        generate_signal_description("activity", user_data),
+        generate_signal_description("typing", user_data),
+    )
     
     return {
         "sleep": sleep_desc,
@@ -28,3 +28,9 @@ class VoiceRequest(BaseModel):
 class InterventionComplete(BaseModel):
     intervention_id: str
     date: Optional[str] = None  # ISO date; default today
+
+
+# Build each model's core schema at import time so the first request to an
+# endpoint doesn't pay the (lazy) schema-construction cost.
+for _m in (TypingEventCreate, CheckinCreate, VoiceRequest, InterventionComplete):
+    _m.model_rebuild()
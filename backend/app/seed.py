@@ -1,69 +1,91 @@
 """Seed: tables + org users for Care Mode. No fake personal data. Score and trend come from your check-ins."""
-import random
 from datetime import date, timedelta
 
+import numpy as np
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from app.db import SessionLocal, init_db
+from app.db import DB_PATH, SessionLocal, init_db
 from app.models import User, RiskScore, VoiceSession
 from app.engine.voice_features import VOICE_KEYS, BASELINE_N
 
+# Sentinel next to the database (so a data-dir wipe clears it too) holding the
+# date of the last seed run. The seed data is date-relative, so one run per
+# day keeps the org demo windows fresh while warm restarts skip the row walk.
+_SEED_MARKER = DB_PATH + ".seeded"
+
+
+def _already_seeded_today() -> bool:
+    try:
+        with open(_SEED_MARKER) as f:
+            return f.read().strip() == date.today().isoformat()
+    except OSError:
+        return False
+
+
+def _mark_seeded() -> None:
+    try:
+        with open(_SEED_MARKER, "w") as f:
+            f.write(date.today().isoformat())
+    except OSError:
+        pass
+
 
-def _seed_demo_user(db: Session) -> None:
+def _seed_demo_user(db: Session, existing_uids: set[str]) -> None:
     """Ensure 'demo' user exists when Firebase is not configured (fallback). No fake data."""
-    if db.query(User).filter(User.id == "demo").first():
+    if "demo" in existing_uids:
         return
     db.add(User(id="demo", is_org_user=False))
-    db.commit()
+    existing_uids.add("demo")
 
 
-def _seed_org_users(db: Session) -> None:
+# (status, base wellbeing score) per org user -- a mix of stable, watch and
+# high so the Care Mode summary has a distribution. Score = base + (i % 15).
+_ORG_PROFILES = [("Stable", 75)] * 5 + [("Watch", 50)] * 3 + [("High", 30)] * 2
+
+
+def _seed_org_users(db: Session, existing_uids: set[str]) -> None:
     """10 fake org users for Care Mode."""
-    for i in range(10):
-        uid = f"org_user_{i}"
-        if db.query(User).filter(User.id == uid).first():
-            continue
-        db.add(User(id=uid, is_org_user=True))
-    db.commit()
+    uids = [f"org_user_{i}" for i in range(len(_ORG_PROFILES))]
+    rows = [{"id": uid, "is_org_user": True} for uid in uids if uid not in existing_uids]
+    if rows:
+        db.execute(insert(User), rows)
+    existing_uids.update(uids)
 
 
-def _seed_org_daily_and_risk(db: Session) -> None:
+def _seed_org_daily_and_risk(db: Session, existing: set[tuple[str, date]]) -> None:
     """Give each org user some risk scores so org summary has distribution."""
     today = date.today()
-    # Mix: some stable, some watch, some high
-    statuses = ["Stable"] * 5 + ["Watch"] * 3 + ["High"] * 2
-    for i in range(10):
+    rows = []
+    for i, (status, base) in enumerate(_ORG_PROFILES):
         uid = f"org_user_{i}"
+        score = base + (i % 15)
         for d in range(14):
             dte = today - timedelta(days=d)
-            if db.query(RiskScore).filter(RiskScore.user_id == uid, RiskScore.date == dte).first():
+            if (uid, dte) in existing:
                 continue
-            # Assign score based on status
-            s = statuses[i]
-            if s == "Stable":
-                score = 75 + (i % 15)
-            elif s == "Watch":
-                score = 50 + (i % 15)
-            else:
-                score = 30 + (i % 15)
-            db.add(RiskScore(
-                user_id=uid,
-                date=dte,
-                wellbeing_score=float(score),
-                status=s,
-                momentum="stable",
-                confidence="high",
-                drivers=[],
-            ))
-    db.commit()
-
-
-def _seed_demo_voice_baseline(db: Session) -> None:
+            rows.append({
+                "user_id": uid,
+                "date": dte,
+                "wellbeing_score": float(score),
+                "status": status,
+                "momentum": "stable",
+                "confidence": "high",
+                "drivers": [],
+            })
+    if rows:
+        # Core executemany: skips ORM unit-of-work bookkeeping entirely;
+        # seed rows never need to live in the identity map.
+        db.execute(insert(RiskScore), rows)
+
+
+def _seed_demo_voice_baseline(db: Session, existing_uids: set[str], taken: set[date]) -> None:
     """Seed 7 baseline VoiceSessions for 'demo' user so first real submission gets a strain level (no 'Building baseline')."""
     demo_id = "demo"
-    if db.query(User).filter(User.id == demo_id).first() is None:
+    if demo_id not in existing_uids:
         return  # demo user must exist first
-    existing = db.query(VoiceSession).filter(VoiceSession.user_id == demo_id).count()
+    existing = len(taken)
     if existing >= BASELINE_N:
         return
     # Plausible eGeMAPS-like values (neutral baseline); small random variation per session
@@ -79,33 +101,63 @@ def _seed_demo_voice_baseline(db: Session) -> None:
     }
     today = date.today()
     to_create = BASELINE_N - existing
+    # One vectorized draw for all sessions' noise instead of a Python-level
+    # random.gauss call per key per session.
+    rng = np.random.default_rng()
+    keys = [k for k in VOICE_KEYS if k in base_values]
+    means = np.array([base_values[k] for k in keys])
+    values = means + rng.normal(0.0, 0.05 * np.abs(means), size=(to_create, len(keys)))
+    # .tolist() for plain Python floats; sqlite3 can't bind numpy scalars.
+    durations = rng.uniform(11.0, 14.0, size=to_create).tolist()
+    zero_pad = {k: 0.0 for k in VOICE_KEYS if k not in base_values}
+    rows = []
     for i in range(to_create):
         dte = today - timedelta(days=i + 1)  # yesterday, 2 days ago, ... so baseline is before today
-        if db.query(VoiceSession).filter(VoiceSession.user_id == demo_id, VoiceSession.date == dte).first():
+        if dte in taken:
             continue
-        features = {k: base_values.get(k, 0.0) + random.gauss(0, 0.05 * abs(base_values.get(k, 1))) for k in VOICE_KEYS if k in base_values}
-        for k in VOICE_KEYS:
-            if k not in features:
-                features[k] = 0.0
-        db.add(VoiceSession(
-            user_id=demo_id,
-            date=dte,
-            duration_sec=12.0 + random.uniform(-1, 2),
-            voice_features=features,
-            voice_strain_score=0,
-            voice_strain_level="low",
-            voice_confidence="low" if (to_create - i) < 4 else "medium",
-        ))
-    db.commit()
+        features = dict(zip(keys, values[i].tolist()))
+        features.update(zero_pad)
+        rows.append({
+            "user_id": demo_id,
+            "date": dte,
+            "duration_sec": durations[i],
+            "voice_features": features,
+            "voice_strain_score": 0,
+            "voice_strain_level": "low",
+            "voice_confidence": "low" if (to_create - i) < 4 else "medium",
+        })
+    if rows:
+        db.execute(insert(VoiceSession), rows)
 
 
 def run_seed() -> None:
     init_db()
+    if _already_seeded_today():
+        return
     db = SessionLocal()
     try:
-        _seed_demo_user(db)
-        _seed_demo_voice_baseline(db)
-        _seed_org_users(db)
-        _seed_org_daily_and_risk(db)
+        # Preload what already exists in three SELECTs; the helpers test set
+        # membership instead of issuing their own existence queries.
+        existing_uids = {u for (u,) in db.query(User.id).all()}
+        existing_risk = {
+            (u, d)
+            for u, d in db.query(RiskScore.user_id, RiskScore.date)
+            .filter(RiskScore.user_id.like("org_user_%"))
+            .all()
+        }
+        demo_voice_dates = {
+            d
+            for (d,) in db.query(VoiceSession.date)
+            .filter(VoiceSession.user_id == "demo")
+            .all()
+        }
+        _seed_demo_user(db, existing_uids)
+        _seed_demo_voice_baseline(db, existing_uids, demo_voice_dates)
+        _seed_org_users(db, existing_uids)
+        _seed_org_daily_and_risk(db, existing_risk)
+        # Helpers stage their inserts; one commit means one fsync for the
+        # whole seed pass instead of one per helper.
+        db.commit()
     finally:
         db.close()
+    _mark_seeded()
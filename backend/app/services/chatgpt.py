@@ -1,5 +1,10 @@
 """ChatGPT API service for AI-powered insights and signal descriptions."""
+import logging
 import os
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Optional
 
 try:
@@ -9,26 +14,230 @@ except ModuleNotFoundError:
     AsyncOpenAI = None  # type: ignore
     _OPENAI_AVAILABLE = False
 
+# orjson parses ~3x faster than the stdlib; fall back quietly if missing.
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
+from app.engine.insight import DRIVER_LABELS
+
+# Lazy %s formatting via the logger: no string work when the level is off,
+# and no stdout lock contention between coroutines under load.
+_log = logging.getLogger(__name__)
+
 # Initialize OpenAI client (will use OPENAI_API_KEY from environment)
 _client: Any = None
+_client_lock = threading.Lock()
+
+# All static instructions live in the system messages: the user message
+# carries only the per-request values, so the static prefix is eligible for
+# server-side prompt caching and the token count per call stays small.
+_INSIGHT_SYSTEM = """You are a compassionate AI assistant helping home caregivers monitor their wellbeing. Always respond with valid JSON.
+
+Given the caregiver's wellbeing status, detected drivers, and check-in data, generate:
+1. A brief, empathetic insight (2-3 sentences max) that:
+   - Acknowledges what we're noticing in their patterns
+   - Is supportive and non-alarming
+   - Focuses on pattern awareness, not diagnosis
+   - Speaks directly to someone caring for a patient at home
+   - Is warm and understanding
+
+2. Two specific, actionable micro-actions (1 short sentence each) that:
+   - Are personalized based on their current data and drivers
+   - Are small, achievable steps (under 5 minutes when possible)
+   - Directly address the drivers we detected
+   - Are practical for someone caring for a patient at home
+   - Vary based on their specific situation (don't repeat the same actions every time)
+
+Format your response as JSON:
+{
+  "insight": "your insight text here",
+  "actions": ["first action", "second action"]
+}
+
+IMPORTANT:
+- Use periods or commas instead of em dashes. Never use em dashes (—) or en dashes (–).
+- Make actions specific and personalized to their data.
+- Vary the actions based on their current situation."""
+
+_SIGNAL_SYSTEM = "You are a supportive wellbeing assistant for home caregivers."
+
+# Per-signal static instructions; the user message adds only the data line.
+_SIGNAL_RULES = {
+    "sleep": """Generate a brief, empathetic 1-sentence description about sleep tracking for a home caregiver.
+
+Write a warm, supportive sentence (max 20 words) that:
+- Mentions sleep/rest in the context of caregiving
+- Is encouraging and understanding
+- Use periods or commas, never em dashes (—) or en dashes (–)
+- No labels or formatting, just the sentence.""",
+    "activity": """Generate a brief, empathetic 1-sentence description about activity tracking for a home caregiver.
+
+Write a warm, supportive sentence (max 20 words) that:
+- Mentions movement/activity in the context of caregiving
+- Is encouraging and understanding
+- Does NOT mention specific numbers or minutes
+- Use periods or commas, never em dashes (—) or en dashes (–)
+- No labels or formatting, just the sentence.""",
+    "typing": """Generate a brief, empathetic 1-sentence description about typing pattern tracking for a home caregiver.
+
+Write a warm, supportive sentence (max 20 words) that:
+- Mentions typing rhythm in the context of caregiving stress
+- Reassures that no content is stored
+- Is encouraging and understanding
+- Use periods or commas, never em dashes (—) or en dashes (–)
+- No labels or formatting, just the sentence.""",
+}
+
+_INTERVENTION_SYSTEM = """You are a compassionate AI assistant helping home caregivers choose personalized small steps to support their wellbeing.
+
+You will be given the caregiver's wellbeing status, detected drivers, check-in data, and a list of small, actionable steps (interventions). Select 2-3 interventions that would be MOST helpful and relevant for this caregiver right now, based on their current patterns and needs.
+
+Instructions:
+- Select 2-3 interventions that directly address their current patterns, especially the detected drivers
+- Choose interventions that are realistic and achievable for someone caring for a patient at home
+- Prioritize interventions that match their specific needs (e.g., if sleep is an issue, choose sleep-related steps)
+- Return ONLY the exact text of the selected interventions, one per line
+- Do not number them or add any formatting
+- Never use em dashes (—) or en dashes (–). Use periods or commas instead.
+- If no interventions seem relevant, choose the most generally supportive ones"""
+
+# Full per-signal system messages (persona + static rules), built once.
+_SIGNAL_SYSTEMS = {t: _SIGNAL_SYSTEM + "\n\n" + r for t, r in _SIGNAL_RULES.items()}
+
+# One translate pass replaces both dashes in a single scan/allocation,
+# instead of two chained .replace() passes per string.
+_DASH_TABLE = str.maketrans({"—": ". ", "–": ". "})
+
+# Strict schema for generate_insight responses: the API validates the shape
+# server-side, so the parse-failure fallback is effectively dead code.
+_INSIGHT_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "insight",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "required": ["insight", "actions"],
+            "additionalProperties": False,
+            "properties": {
+                "insight": {"type": "string"},
+                "actions": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+    },
+}
+
+_SIGNAL_FALLBACKS = {
+    "sleep": "From your check-in. Rest matters when you're caring for someone at home.",
+    "activity": "Movement from check-in. Even short breaks help when you're on care duty.",
+    "typing": "Rhythm from typing. No content stored. Helps us sense stress and load.",
+}
+
+# Signal descriptions only vary with coarse input buckets (half-hour of
+# sleep, quality as an integer, the activity descriptor), so identical
+# buckets within the TTL reuse the cached sentence instead of paying an
+# API round trip. Plain dict, benign races on the single event loop.
+_DESC_CACHE: dict[tuple, tuple[float, str]] = {}
+_DESC_TTL_SEC = 900
+
+
+@lru_cache(maxsize=512)
+def _build_context_str(
+    sleep_hours: Optional[float],
+    sleep_quality: Optional[float],
+    mood_value: Optional[float],
+    activity_minutes: Optional[float],
+) -> str:
+    """Format the check-in context line; memoized since inputs repeat within a day."""
+    context_parts = []
+    if sleep_hours is not None:
+        context_parts.append(f"Sleep: {sleep_hours:.1f} hours")
+    if sleep_quality is not None:
+        context_parts.append(f"Sleep quality: {sleep_quality:.1f}/5")
+    if mood_value is not None:
+        context_parts.append(f"Mood: {mood_value:.1f}/10")
+    if activity_minutes is not None:
+        context_parts.append(f"Activity: {activity_minutes:.0f} minutes")
+    return "; ".join(context_parts) if context_parts else "Limited data available"
+
+
+@lru_cache(maxsize=512)
+def _build_descriptive_context_str(
+    sleep_hours: Optional[float],
+    sleep_quality: Optional[float],
+    mood_value: Optional[float],
+    activity_minutes: Optional[float],
+) -> str:
+    """Context line with mood/activity as words; used for intervention selection."""
+    context_parts = []
+    if sleep_hours is not None:
+        context_parts.append(f"Sleep: {sleep_hours:.1f} hours")
+    if sleep_quality is not None:
+        context_parts.append(f"Sleep quality: {sleep_quality:.1f}/5")
+    if mood_value is not None:
+        if mood_value < 4:
+            mood_desc = "very low"
+        elif mood_value < 6:
+            mood_desc = "low"
+        elif mood_value < 8:
+            mood_desc = "moderate"
+        else:
+            mood_desc = "good"
+        context_parts.append(f"Mood: {mood_desc} ({mood_value:.1f}/10)")
+    if activity_minutes is not None:
+        if activity_minutes < 30:
+            activity_desc = "minimal"
+        elif activity_minutes < 90:
+            activity_desc = "some"
+        elif activity_minutes < 150:
+            activity_desc = "good"
+        else:
+            activity_desc = "very active"
+        context_parts.append(f"Activity: {activity_desc}")
+    return "; ".join(context_parts) if context_parts else "Limited data available"
 
 
 def get_client() -> Optional[Any]:
     """Get OpenAI client instance, or None if package missing or API key not configured."""
     global _client
     if not _OPENAI_AVAILABLE:
-        print("DEBUG: OpenAI package not available")
+        _log.debug("OpenAI package not available")
         return None
     if _client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            print("DEBUG: OPENAI_API_KEY not found in environment")
-            return None
-        print(f"DEBUG: OpenAI client initialized (key starts with: {api_key[:7]}...)")
-        _client = AsyncOpenAI(api_key=api_key)
+        with _client_lock:
+            if _client is not None:  # another thread built it while we waited
+                return _client
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                _log.debug("OPENAI_API_KEY not found in environment")
+                return None
+            _log.debug("OpenAI client initialized (key starts with: %s...)", api_key[:7])
+            # Tuned httpx pool: keep-alive connections are reused across requests
+            # so concurrent insight/signal calls don't pay DNS + TLS setup each
+            # time. httpx ships with the openai package.
+            import httpx
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            )
+            _client = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=2)
     return _client
 
 
+async def close_client() -> None:
+    """Close the shared client's connection pool. Called at app shutdown."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
 async def generate_insight(drivers: list[str], status: str, user_context: dict) -> dict[str, str]:
     """
     Generate AI-powered insight text using ChatGPT.
@@ -47,87 +256,43 @@ async def generate_insight(drivers: list[str], status: str, user_context: dict)
         from app.engine.insight import generate_insight as fallback_insight
         return fallback_insight(drivers, status)
     
-    # Format driver labels
-    driver_labels = {
-        "sleep_hours": "sleep amount",
-        "sleep_quality": "sleep quality",
-        "activity_minutes": "activity level",
-        "mood_value": "mood",
-        "typing_avg_interval_ms": "typing rhythm",
-        "typing_std_ms": "typing consistency",
-        "typing_backspace_ratio": "typing friction",
-        "typing_fragmentation": "focus fragmentation",
-        "voice_strain_score": "voice strain",
-    }
-    
-    driver_names = [driver_labels.get(d, d) for d in drivers[:3]]
-    driver_str = ", ".join(driver_names) if driver_names else "general patterns"
-    
-    # Build context string
-    context_parts = []
-    if user_context.get("sleep_hours") is not None:
-        context_parts.append(f"Sleep: {user_context['sleep_hours']:.1f} hours")
-    if user_context.get("sleep_quality") is not None:
-        context_parts.append(f"Sleep quality: {user_context['sleep_quality']:.1f}/5")
-    if user_context.get("mood_value") is not None:
-        context_parts.append(f"Mood: {user_context['mood_value']:.1f}/10")
-    if user_context.get("activity_minutes") is not None:
-        context_parts.append(f"Activity: {user_context['activity_minutes']:.0f} minutes")
-    
-    context_str = "; ".join(context_parts) if context_parts else "Limited data available"
-    
-    prompt = f"""You are a compassionate AI assistant helping home caregivers monitor their wellbeing. 
-
-The caregiver's current wellbeing status is: {status}
-Recent changes detected in: {driver_str}
-Today's check-in data: {context_str}
+    # islice over a genexpr: no intermediate slice, and the list is only
+    # materialized because the response carries it.
+    driver_names = list(islice((DRIVER_LABELS.get(d, d) for d in drivers), 3))
+    driver_str = ", ".join(driver_names) or "general patterns"
 
-Generate:
-1. A brief, empathetic insight (2-3 sentences max) that:
-   - Acknowledges what we're noticing in their patterns
-   - Is supportive and non-alarming
-   - Focuses on pattern awareness, not diagnosis
-   - Speaks directly to someone caring for a patient at home
-   - Is warm and understanding
+    context_str = _build_context_str(
+        user_context.get("sleep_hours"),
+        user_context.get("sleep_quality"),
+        user_context.get("mood_value"),
+        user_context.get("activity_minutes"),
+    )
 
-2. Two specific, actionable micro-actions (1 short sentence each) that:
-   - Are personalized based on their current data and drivers
-   - Are small, achievable steps (under 5 minutes when possible)
-   - Directly address the drivers we detected
-   - Are practical for someone caring for a patient at home
-   - Vary based on their specific situation (don't repeat the same actions every time)
-
-Format your response as JSON:
-{{
-  "insight": "your insight text here",
-  "actions": ["first action", "second action"]
-}}
-
-IMPORTANT: 
-- Use periods or commas instead of em dashes. Never use em dashes (—) or en dashes (–).
-- Make actions specific and personalized to their data.
-- Vary the actions based on their current situation."""
+    prompt = (
+        f"The caregiver's current wellbeing status is: {status}\n"
+        f"Recent changes detected in: {driver_str}\n"
+        f"Today's check-in data: {context_str}"
+    )
 
     try:
         response = await client.chat.completions.create(
             model="gpt-4o-mini",  # Using mini for cost efficiency
             messages=[
-                {"role": "system", "content": "You are a supportive wellbeing assistant for home caregivers. Always respond with valid JSON."},
+                {"role": "system", "content": _INSIGHT_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=300,
             temperature=0.8,  # Higher temperature for more variety
-            response_format={"type": "json_object"},
+            response_format=_INSIGHT_SCHEMA,
         )
-        
-        import json
+
         try:
-            result = json.loads(response.choices[0].message.content.strip())
-        except json.JSONDecodeError:
+            result = _json_loads(response.choices[0].message.content)
+        except ValueError:
             # If JSON parsing fails, try to extract from text
             content = response.choices[0].message.content.strip()
             # Fallback: try to find JSON-like structure or parse as text
-            print(f"Failed to parse JSON, content: {content[:200]}")
+            _log.warning("Failed to parse JSON, content: %s", content[:200])
             from app.engine.insight import suggest_actions
             fallback_result = {
                 "short_insight": content.split('\n')[0] if content else "We're noticing some patterns in your wellbeing.",
@@ -140,8 +305,8 @@ IMPORTANT:
         actions = result.get("actions", [])
         
         # Remove em dashes and replace with periods or commas
-        insight_text = insight_text.replace('—', '. ').replace('–', '. ')
-        actions = [a.replace('—', '. ').replace('–', '. ').strip() for a in actions if a.strip()]
+        insight_text = insight_text.translate(_DASH_TABLE)
+        actions = [s for a in actions if (s := a.translate(_DASH_TABLE).strip())]
         
         # Ensure we have at least one action, fallback if needed
         if not actions:
@@ -155,7 +320,7 @@ IMPORTANT:
         }
     except Exception as e:
         # Fallback to template-based on error
-        print(f"ChatGPT API error: {e}")
+        _log.warning("ChatGPT API error: %s", e)
         from app.engine.insight import generate_insight as fallback_insight
         fallback_result = fallback_insight(drivers, status)
         # Ensure suggested_actions is included in fallback
@@ -178,33 +343,28 @@ async def generate_signal_description(signal_type: str, user_data: dict) -> str:
     """
     client = get_client()
     if not client:
-        print(f"DEBUG: No OpenAI client for signal {signal_type}, using fallback")
+        _log.debug("No OpenAI client for signal %s, using fallback", signal_type)
         # Fallback to static descriptions
-        fallbacks = {
-            "sleep": "From your check-in. Rest matters when you're caring for someone at home.",
-            "activity": "Movement from check-in. Even short breaks help when you're on care duty.",
-            "typing": "Rhythm from typing. No content stored. Helps us sense stress and load.",
-        }
-        return fallbacks.get(signal_type, "Tracking your patterns.")
+        return _SIGNAL_FALLBACKS.get(signal_type, "Tracking your patterns.")
     
-    # Build context based on signal type
+    # Build context based on signal type; each branch also derives the coarse
+    # cache bucket the generated sentence actually depends on.
     if signal_type == "sleep":
+        sleep_hours = user_data.get("sleep_hours")
+        sleep_quality = user_data.get("sleep_quality")
+        if sleep_hours is not None:
+            sleep_hours = round(sleep_hours * 2) / 2  # nearest half hour
+        if sleep_quality is not None:
+            sleep_quality = float(round(sleep_quality))
+        bucket = (sleep_hours, sleep_quality)
         context = []
-        if user_data.get("sleep_hours") is not None:
-            context.append(f"{user_data['sleep_hours']:.1f} hours")
-        if user_data.get("sleep_quality") is not None:
-            context.append(f"quality: {user_data['sleep_quality']:.1f}/5")
+        if sleep_hours is not None:
+            context.append(f"{sleep_hours:.1f} hours")
+        if sleep_quality is not None:
+            context.append(f"quality: {sleep_quality:.1f}/5")
         data_str = ", ".join(context) if context else "no recent data"
-        prompt = f"""Generate a brief, empathetic 1-sentence description about sleep tracking for a home caregiver.
-
-Their recent sleep: {data_str}
+        prompt = f"Their recent sleep: {data_str}"
 
-Write a warm, supportive sentence (max 20 words) that:
-- Mentions sleep/rest in the context of caregiving
-- Is encouraging and understanding
-- Use periods or commas, never em dashes (—) or en dashes (–)
-- No labels or formatting, just the sentence."""
-    
     elif signal_type == "activity":
         # Convert activity_minutes back to a category for more natural description
         activity_minutes = user_data.get("activity_minutes")
@@ -219,58 +379,41 @@ Write a warm, supportive sentence (max 20 words) that:
                 activity_desc = "very active"
         else:
             activity_desc = "no recent data"
-        
-        prompt = f"""Generate a brief, empathetic 1-sentence description about activity tracking for a home caregiver.
-
-Their recent activity level: {activity_desc}
+        bucket = (activity_desc,)
+        prompt = f"Their recent activity level: {activity_desc}"
 
-Write a warm, supportive sentence (max 20 words) that:
-- Mentions movement/activity in the context of caregiving
-- Is encouraging and understanding
-- Does NOT mention specific numbers or minutes
-- Use periods or commas, never em dashes (—) or en dashes (–)
-- No labels or formatting, just the sentence."""
-    
     else:  # typing
-        context = []
-        if user_data.get("typing_avg_interval_ms") is not None:
-            context.append("typing patterns detected")
-        data_str = ", ".join(context) if context else "no recent data"
-        prompt = f"""Generate a brief, empathetic 1-sentence description about typing pattern tracking for a home caregiver.
+        has_typing = user_data.get("typing_avg_interval_ms") is not None
+        bucket = (has_typing,)
+        data_str = "typing patterns detected" if has_typing else "no recent data"
+        prompt = f"Their recent typing: {data_str}"
 
-Their recent typing: {data_str}
+    cache_key = (signal_type, bucket)
+    now = time.monotonic()
+    cached = _DESC_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
 
-Write a warm, supportive sentence (max 20 words) that:
-- Mentions typing rhythm in the context of caregiving stress
-- Reassures that no content is stored
-- Is encouraging and understanding
-- Use periods or commas, never em dashes (—) or en dashes (–)
-- No labels or formatting, just the sentence."""
-    
     try:
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "system", "content": "You are a supportive wellbeing assistant for home caregivers."},
+                {"role": "system", "content": _SIGNAL_SYSTEMS[signal_type if signal_type in _SIGNAL_SYSTEMS else "typing"]},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=50,
             temperature=0.7,
         )
-        
+
         description = response.choices[0].message.content.strip()
         # Remove em dashes and replace with periods or commas
-        description = description.replace('—', '. ').replace('–', '. ')
+        description = description.translate(_DASH_TABLE)
+        _DESC_CACHE[cache_key] = (now + _DESC_TTL_SEC, description)
         return description
     except Exception as e:
-        print(f"ChatGPT API error for signal {signal_type}: {e}")
+        _log.warning("ChatGPT API error for signal %s: %s", signal_type, e)
         # Fallback
-        fallbacks = {
-            "sleep": "From your check-in. Rest matters when you're caring for someone at home.",
-            "activity": "Movement from check-in. Even short breaks help when you're on care duty.",
-            "typing": "Rhythm from typing. No content stored. Helps us sense stress and load.",
-        }
-        return fallbacks.get(signal_type, "Tracking your patterns.")
+        return _SIGNAL_FALLBACKS.get(signal_type, "Tracking your patterns.")
 
 
 async def select_interventions(
@@ -297,81 +440,30 @@ async def select_interventions(
         from app.engine.interventions import get_actions_for_drivers
         return get_actions_for_drivers(drivers)
     
-    # Format driver labels
-    driver_labels = {
-        "sleep_hours": "sleep amount",
-        "sleep_quality": "sleep quality",
-        "activity_minutes": "activity level",
-        "mood_value": "mood",
-        "typing_avg_interval_ms": "typing rhythm",
-        "typing_std_ms": "typing consistency",
-        "typing_backspace_ratio": "typing friction",
-        "typing_fragmentation": "focus fragmentation",
-        "voice_strain_score": "voice strain",
-    }
-    
-    driver_names = [driver_labels.get(d, d) for d in drivers[:3]]
-    driver_str = ", ".join(driver_names) if driver_names else "general patterns"
-    
-    # Build context string
-    context_parts = []
-    if user_context.get("sleep_hours") is not None:
-        context_parts.append(f"Sleep: {user_context['sleep_hours']:.1f} hours")
-    if user_context.get("sleep_quality") is not None:
-        context_parts.append(f"Sleep quality: {user_context['sleep_quality']:.1f}/5")
-    if user_context.get("mood_value") is not None:
-        mood_val = user_context['mood_value']
-        if mood_val < 4:
-            mood_desc = "very low"
-        elif mood_val < 6:
-            mood_desc = "low"
-        elif mood_val < 8:
-            mood_desc = "moderate"
-        else:
-            mood_desc = "good"
-        context_parts.append(f"Mood: {mood_desc} ({mood_val:.1f}/10)")
-    if user_context.get("activity_minutes") is not None:
-        activity = user_context['activity_minutes']
-        if activity < 30:
-            activity_desc = "minimal"
-        elif activity < 90:
-            activity_desc = "some"
-        elif activity < 150:
-            activity_desc = "good"
-        else:
-            activity_desc = "very active"
-        context_parts.append(f"Activity: {activity_desc}")
-    
-    context_str = "; ".join(context_parts) if context_parts else "Limited data available"
-    
+    driver_str = ", ".join(islice((DRIVER_LABELS.get(d, d) for d in drivers), 3)) or "general patterns"
+
+    context_str = _build_descriptive_context_str(
+        user_context.get("sleep_hours"),
+        user_context.get("sleep_quality"),
+        user_context.get("mood_value"),
+        user_context.get("activity_minutes"),
+    )
+
     # Format interventions list for the prompt
     interventions_list = "\n".join([f"{i+1}. {intervention}" for i, intervention in enumerate(all_interventions)])
     
-    prompt = f"""You are a compassionate AI assistant helping home caregivers choose personalized small steps to support their wellbeing.
-
-The caregiver's current wellbeing status is: {status}
-Recent changes detected in: {driver_str}
-Today's check-in data: {context_str}
-
-Below is a list of small, actionable steps (interventions) that caregivers can take. Select 2-3 interventions that would be MOST helpful and relevant for this caregiver right now, based on their current patterns and needs.
-
-Available interventions:
-{interventions_list}
-
-Instructions:
-- Select 2-3 interventions that directly address their current patterns (especially {driver_str if driver_names else "their overall wellbeing"})
-- Choose interventions that are realistic and achievable for someone caring for a patient at home
-- Prioritize interventions that match their specific needs (e.g., if sleep is an issue, choose sleep-related steps)
-- Return ONLY the exact text of the selected interventions, one per line
-- Do not number them or add any formatting
-- Never use em dashes (—) or en dashes (–). Use periods or commas instead.
-- If no interventions seem relevant, choose the most generally supportive ones"""
+    prompt = (
+        f"The caregiver's current wellbeing status is: {status}\n"
+        f"Recent changes detected in: {driver_str}\n"
+        f"Today's check-in data: {context_str}\n\n"
+        f"Available interventions:\n{interventions_list}"
+    )
 
     try:
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "system", "content": "You are a supportive wellbeing assistant for home caregivers. Select the most relevant interventions."},
+                {"role": "system", "content": _INTERVENTION_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=200,
@@ -380,20 +472,27 @@ Instructions:
         
         selected_text = response.choices[0].message.content.strip()
         # Remove em dashes from AI-generated text
-        selected_text = selected_text.replace('—', '. ').replace('–', '. ')
+        selected_text = selected_text.translate(_DASH_TABLE)
         # Parse the response - split by newlines and filter to valid interventions
         selected_lines = [line.strip() for line in selected_text.split('\n') if line.strip()]
-        # Match selected lines to actual interventions (handle slight variations)
+        # Match selected lines to actual interventions (handle slight
+        # variations). Lowercase the list once; exact matches hit a dict
+        # instead of re-lowercasing every intervention per line.
+        lowered = [(intv, intv.lower()) for intv in all_interventions]
+        lower_index = {lc: intv for intv, lc in lowered}
         selected = []
         for line in selected_lines:
             # Remove numbering if present (e.g., "1. " or "- ")
             cleaned = line.lstrip('0123456789.- ').strip()
-            # Find matching intervention (fuzzy match)
-            for intervention in all_interventions:
-                if cleaned.lower() == intervention.lower() or cleaned in intervention or intervention in cleaned:
-                    if intervention not in selected:
-                        selected.append(intervention)
+            hit = lower_index.get(cleaned.lower())
+            if hit is None:
+                # Fuzzy fallback: substring match in either direction
+                for intervention, _ in lowered:
+                    if cleaned in intervention or intervention in cleaned:
+                        hit = intervention
                         break
+            if hit is not None and hit not in selected:
+                selected.append(hit)
         
         # Ensure we have 2-3 interventions
         if len(selected) < 2:
@@ -409,7 +508,7 @@ Instructions:
         return selected[:3]  # Return max 3
         
     except Exception as e:
-        print(f"ChatGPT API error for intervention selection: {e}")
+        _log.warning("ChatGPT API error for intervention selection: %s", e)
         # Fallback to driver-based selection
         from app.engine.interventions import get_actions_for_drivers
         return get_actions_for_drivers(drivers)